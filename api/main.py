@@ -1,19 +1,24 @@
 """
 Main FastAPI application for the Brand Resonance App.
 """
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-import uuid
-from typing import Dict, List, Optional, Any
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from typing import Dict, List, NamedTuple, Optional, Any, Awaitable, Callable, Tuple
 import os
-import json
+import asyncio
+import gzip
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
+import brotli
+from uuid_utils import uuid7
 
+from api.store import Store, MemoryStore, RedisStore, dumps
 from models.data_models import (
-    Brand, 
-    ResonanceResult, 
+    Brand,
+    MetricsBundle,
+    ResonanceResult,
     AnalysisRequest,
     TopicAnalysis,
     SentimentDistribution,
@@ -27,11 +32,23 @@ from models.data_models import (
 from models.scoring_engine import ResonanceScorer
 from models.llm_integration import LLMMetricGenerator
 
+# Local alias to avoid the attribute lookup on every timestamp
+_now = datetime.now
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Brand Resonance API",
     description="API for calculating and analyzing brand resonance scores",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -51,63 +68,287 @@ app.add_middleware(
 scorer = ResonanceScorer()
 llm_generator = LLMMetricGenerator()
 
-# In-memory storage (would be replaced with a database in production)
-brands = {}
-resonance_results = {}
-topic_analyses = {}
-sentiment_analyses = {}
-advocacy_analyses = {}
-geographic_spreads = {}
-demographic_spreads = {}
-intent_analyses = {}
-comparison_results = {}
-
-# Helper function to save data to JSON files
-def save_to_json(data, filename):
-    """Save data to a JSON file in the data directory."""
-    os.makedirs("data", exist_ok=True)
-    with open(f"data/{filename}.json", "w") as f:
-        json.dump(data, f, default=str)
-
-# Helper function to load data from JSON files
-def load_from_json(filename):
-    """Load data from a JSON file in the data directory."""
-    try:
-        with open(f"data/{filename}.json", "r") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
+# Metric names in scoring order
+METRIC_NAMES: Tuple[str, ...] = tuple(scorer.METRIC_WEIGHTS.keys())
+
+# Supplementary analyses generated for every analyzed brand, and their stores
+ANALYSIS_STORE_NAMES = {
+    "topic_analysis": "topic_analyses",
+    "sentiment_analysis": "sentiment_analyses",
+    "advocacy_analysis": "advocacy_analyses",
+    "geographic_spread": "geographic_spreads",
+    "demographic_spread": "demographic_spreads",
+    "intent_analysis": "intent_analyses",
+}
+ANALYSIS_NAMES: Tuple[str, ...] = tuple(ANALYSIS_STORE_NAMES)
+
+# Generator method that produces every metric in one batched LLM call
+METRICS_GENERATOR = "all_metrics_batched"
+
+# Async generator method for the metrics and each analysis, resolved once at startup
+GENERATOR_FNS: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+    name: getattr(llm_generator, f"agenerate_{name}") for name in (METRICS_GENERATOR,) + ANALYSIS_NAMES
+}
+
+# Stores kept across restarts. Besides these, "brand_name_index" maps
+# lowercased brand names to brand IDs, the "results_by_brand" lists hold each
+# brand's result IDs in timestamp order, and "meta" holds bookkeeping flags.
+PERSISTED_STORES: Tuple[str, ...] = (
+    "brands",
+    "resonance_results",
+    "topic_analyses",
+    "sentiment_analyses",
+    "advocacy_analyses",
+    "geographic_spreads",
+    "demographic_spreads",
+    "intent_analyses",
+    "comparison_results",
+)
+
+# Stores whose documents are decoded into models when read
+STORE_MODELS = {"brands": Brand}
+
+# Seconds between background flushes of dirty stores to JSON files
+FLUSH_INTERVAL = 2.0
+
+# With REDIS_URL set, state lives in Redis and can be shared by several
+# workers. Otherwise it lives in process memory, persisted to data/*.json.
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    store: Store = RedisStore(REDIS_URL, models=STORE_MODELS)
+else:
+    store = MemoryStore(PERSISTED_STORES, models=STORE_MODELS, flush_interval=FLUSH_INTERVAL)
+
+async def generate(method_name: str, request: AnalysisRequest) -> Dict[str, Any]:
+    """
+    Call the generator method for method_name on a request.
+    
+    The generator serves repeated requests from its own disk and semantic
+    caches, whose keys cover the models and prompts behind each result, and
+    hands out fresh copies that callers may annotate.
+    """
+    return await GENERATOR_FNS[method_name](request.brand_name, request.industry, request.additional_context)
+
+def new_id() -> str:
+    """Generate an ID for a stored document; IDs sort in creation order."""
+    return uuid7().hex
+
+async def index_brand_name(brand_id: str, name: str) -> bool:
+    """
+    Add a brand to brand_name_index, keeping the first brand with that name.
+    
+    Returns:
+        Whether brand_id is now the indexed brand for the name
+    """
+    key = name.lower()
+    if await store.setdefault("brand_name_index", key, brand_id):
+        return True
+    return await store.get("brand_name_index", key) == brand_id
+
+async def unindex_brand_name(brand_id: str, name: str):
+    """Remove a brand from brand_name_index."""
+    key = name.lower()
+    if await store.get("brand_name_index", key) != brand_id:
+        return
+    
+    await store.delete("brand_name_index", key)
+    # Fall back to another brand with the same name, if there is one
+    async for bid, stored_brand in store.items("brands"):
+        if bid != brand_id and stored_brand.name.lower() == key:
+            await store.setdefault("brand_name_index", key, bid)
+            break
+
+async def rebuild_indexes():
+    """Rebuild brand_name_index and results_by_brand from the stored data."""
+    async for bid, stored_brand in store.items("brands"):
+        await index_brand_name(bid, stored_brand.name)
+    
+    results = [result async for _, result in store.items("resonance_results")]
+    for result in sorted(results, key=lambda r: r["timestamp"]):
+        await store.append("results_by_brand", result["brand_id"], result["id"])
+
+def json_array(items: List[bytes]) -> bytes:
+    """Join serialized JSON documents into a serialized JSON array."""
+    return b"[" + b",".join(items) + b"]"
+
+# Maximum total size of the bodies kept in _response_cache, compressed copies included
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+class CachedResponse(NamedTuple):
+    """Serialized body of a view of a store at one store version."""
+    cache_key: Tuple[str, Any]
+    version: Any
+    payload: bytes
+    etag: str
+    # Content coding -> compressed body, filled in on demand
+    compressed: Dict[str, bytes]
+
+class ResponseCache:
+    """
+    Serialized GET responses, keyed by (store name, view key).
+    
+    Only the latest store version of each view is kept: building a newer
+    one replaces it. A view that reads several stores is versioned by a
+    tuple of their versions. The least recently used views are evicted once their
+    bodies and compressed copies exceed max_bytes in total.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[str, Any], CachedResponse]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, store_name: str, key: Any, version: Any) -> Optional[CachedResponse]:
+        """Get the cached response of a view at a store version, or None."""
+        entry = self._entries.get((store_name, key))
+        if entry is None or entry.version != version:
+            return None
+        self._entries.move_to_end(entry.cache_key)
+        return entry
+    
+    def put(self, store_name: str, key: Any, version: Any, payload: bytes) -> CachedResponse:
+        """Cache the body of a view at a store version, replacing older versions."""
+        entry = CachedResponse(
+            (store_name, key),
+            version,
+            payload,
+            f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"',
+            {}
+        )
+        old = self._entries.pop(entry.cache_key, None)
+        if old is not None:
+            self.size -= self._entry_size(old)
+        self._entries[entry.cache_key] = entry
+        self.size += len(payload)
+        self._evict()
+        return entry
+    
+    def add_compressed(self, entry: CachedResponse, coding: str, body: bytes):
+        """Record a compressed copy of a cached body."""
+        entry.compressed[coding] = body
+        # The entry may have been replaced or evicted while compressing
+        if self._entries.get(entry.cache_key) is entry:
+            self.size += len(body)
+            self._evict()
+    
+    @staticmethod
+    def _entry_size(entry: CachedResponse) -> int:
+        return len(entry.payload) + sum(len(body) for body in entry.compressed.values())
+    
+    def _evict(self):
+        while self.size > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self.size -= self._entry_size(entry)
+
+_response_cache = ResponseCache(RESPONSE_CACHE_MAX_BYTES)
+
+# Bodies smaller than this are sent uncompressed; compression gains little on them
+COMPRESS_MIN_SIZE = 1024
+
+# Supported content codings in order of preference
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    "br": lambda payload: brotli.compress(payload, quality=4),
+    "gzip": lambda payload: gzip.compress(payload, compresslevel=6, mtime=0),
+}
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check whether an If-None-Match header matches an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.replace("W/", "", 1) == etag for tag in candidates)
+
+def _preferred_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the most preferred supported coding allowed by an Accept-Encoding header."""
+    if not accept_encoding:
+        return None
+    
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    
+    for coding in COMPRESSORS:
+        if coding in accepted or "*" in accepted:
+            return coding
+    return None
+
+async def cached_json_response(
+    request: Request,
+    store_name: str,
+    key: Any,
+    build: Callable[[], Awaitable[Optional[bytes]]],
+    not_found: str = "Not found"
+) -> Response:
+    """
+    Serve a read-only view of a store from pre-serialized bytes.
+    
+    The body produced by build() is fetched once per store version and
+    reused until the store mutates. A build() returning None means the item
+    does not exist and is answered with a 404.
+    """
+    version = await store.version(store_name)
+    entry = _response_cache.get(store_name, key, version)
+    if entry is None:
+        payload = await build()
+        if payload is None:
+            raise HTTPException(status_code=404, detail=not_found)
+        entry = _response_cache.put(store_name, key, version, payload)
+    return await cached_entry_response(request, entry)
+
+async def cached_entry_response(request: Request, entry: CachedResponse) -> Response:
+    """
+    Answer a request with a cached body.
+    
+    Clients accepting Brotli or gzip get a compressed copy, which is made
+    once per cached body. Requests whose If-None-Match header carries the
+    current ETag get an empty 304 response.
+    """
+    payload = entry.payload
+    headers = {"ETag": entry.etag, "Vary": "Accept-Encoding"}
+    
+    coding = None
+    if len(payload) >= COMPRESS_MIN_SIZE:
+        coding = _preferred_encoding(request.headers.get("accept-encoding"))
+    if coding:
+        if coding not in entry.compressed:
+            _response_cache.add_compressed(entry, coding, await asyncio.to_thread(COMPRESSORS[coding], payload))
+        payload = entry.compressed[coding]
+        # Each representation needs its own strong ETag
+        headers["ETag"] = f'{entry.etag[:-1]}-{coding}"'
+    
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if coding:
+        headers["Content-Encoding"] = coding
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 # Load data on startup
 @app.on_event("startup")
 async def startup_event():
-    """Load data from JSON files on startup."""
-    global brands, resonance_results, topic_analyses, sentiment_analyses
-    global advocacy_analyses, geographic_spreads, demographic_spreads, intent_analyses
-    
-    brands = load_from_json("brands")
-    resonance_results = load_from_json("resonance_results")
-    topic_analyses = load_from_json("topic_analyses")
-    sentiment_analyses = load_from_json("sentiment_analyses")
-    advocacy_analyses = load_from_json("advocacy_analyses")
-    geographic_spreads = load_from_json("geographic_spreads")
-    demographic_spreads = load_from_json("demographic_spreads")
-    intent_analyses = load_from_json("intent_analyses")
-    comparison_results = load_from_json("comparison_results")
+    """Open the store and build the lookup indexes if no worker has yet."""
+    await store.start()
+    
+    # The flag is claimed atomically, so only one worker rebuilds shared indexes
+    if await store.setdefault("meta", "indexes_built", True):
+        await rebuild_indexes()
 
 # Save data on shutdown
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Save data to JSON files on shutdown."""
-    save_to_json(brands, "brands")
-    save_to_json(resonance_results, "resonance_results")
-    save_to_json(topic_analyses, "topic_analyses")
-    save_to_json(sentiment_analyses, "sentiment_analyses")
-    save_to_json(advocacy_analyses, "advocacy_analyses")
-    save_to_json(geographic_spreads, "geographic_spreads")
-    save_to_json(demographic_spreads, "demographic_spreads")
-    save_to_json(intent_analyses, "intent_analyses")
-    save_to_json(comparison_results, "comparison_results")
+    """Persist outstanding data and close the store."""
+    await store.close()
 
 # API Routes
 
@@ -120,44 +361,54 @@ async def root():
 async def create_brand(brand: Brand):
     """Create a new brand."""
     if not brand.id:
-        brand.id = str(uuid.uuid4())
+        brand.id = new_id()
+    else:
+        existing = await store.get("brands", brand.id)
+        if existing:
+            await unindex_brand_name(brand.id, existing.name)
     
-    brands[brand.id] = brand.dict()
-    save_to_json(brands, "brands")
+    await store.set("brands", brand.id, brand)
+    await index_brand_name(brand.id, brand.name)
     return brand
 
+async def _all_brands() -> bytes:
+    return json_array([raw async for raw in store.iter_raw("brands")])
+
 @app.get("/brands/", response_model=List[Brand])
-async def get_brands():
+async def get_brands(request: Request):
     """Get all brands."""
-    return list(brands.values())
+    # Stored brands are already validated, so skip response_model re-validation
+    return await cached_json_response(request, "brands", None, _all_brands)
 
 @app.get("/brands/{brand_id}", response_model=Brand)
-async def get_brand(brand_id: str):
+async def get_brand(request: Request, brand_id: str):
     """Get a specific brand by ID."""
-    if brand_id not in brands:
-        raise HTTPException(status_code=404, detail="Brand not found")
-    return brands[brand_id]
+    return await cached_json_response(
+        request, "brands", brand_id, lambda: store.get_raw("brands", brand_id), "Brand not found"
+    )
 
 @app.put("/brands/{brand_id}", response_model=Brand)
 async def update_brand(brand_id: str, brand: Brand):
     """Update a brand."""
-    if brand_id not in brands:
+    existing = await store.get("brands", brand_id)
+    if existing is None:
         raise HTTPException(status_code=404, detail="Brand not found")
     
     brand.id = brand_id
-    brand.updated_at = datetime.now()
-    brands[brand_id] = brand.dict()
-    save_to_json(brands, "brands")
+    brand.updated_at = _now()
+    await unindex_brand_name(brand_id, existing.name)
+    await store.set("brands", brand_id, brand)
+    await index_brand_name(brand_id, brand.name)
     return brand
 
 @app.delete("/brands/{brand_id}")
 async def delete_brand(brand_id: str):
     """Delete a brand."""
-    if brand_id not in brands:
+    deleted_brand = await store.get("brands", brand_id)
+    if deleted_brand is None or not await store.delete("brands", brand_id):
         raise HTTPException(status_code=404, detail="Brand not found")
     
-    del brands[brand_id]
-    save_to_json(brands, "brands")
+    await unindex_brand_name(brand_id, deleted_brand.name)
     return {"message": "Brand deleted successfully"}
 
 @app.post("/analyze/", response_model=ResonanceResult)
@@ -168,12 +419,9 @@ async def analyze_brand(request: AnalysisRequest):
     This endpoint uses the LLM to generate metrics for the brand and then
     calculates the overall resonance score based on the weighted metrics.
     """
-    # Generate metrics using LLM
-    metrics = llm_generator.generate_all_metrics(
-        request.brand_name,
-        request.industry,
-        request.additional_context
-    )
+    # Generate detailed metrics using LLM, all five in a single call
+    metric_details = await generate(METRICS_GENERATOR, request)
+    metrics = {metric_name: details["score"] for metric_name, details in metric_details.items()}
     
     # Calculate overall score
     overall_score = scorer.calculate_score(metrics)
@@ -182,42 +430,40 @@ async def analyze_brand(request: AnalysisRequest):
     category, category_description = scorer.get_score_category(overall_score)
     
     # Create brand if it doesn't exist
-    brand_id = None
-    for bid, brand_data in brands.items():
-        if brand_data["name"].lower() == request.brand_name.lower():
-            brand_id = bid
-            break
+    brand_id = await store.get("brand_name_index", request.brand_name.lower())
     
     if not brand_id:
         brand = Brand(
+            id=new_id(),
             name=request.brand_name,
             industry=request.industry,
             description=request.additional_context
         )
-        brand.id = str(uuid.uuid4())
-        brands[brand.id] = brand.dict()
-        brand_id = brand.id
+        await store.set("brands", brand.id, brand)
+        if await index_brand_name(brand.id, brand.name):
+            brand_id = brand.id
+        else:
+            # Another request created the brand concurrently; use that one
+            await store.delete("brands", brand.id)
+            brand_id = await store.get("brand_name_index", request.brand_name.lower())
+    
+    # One timestamp for everything produced by this request. It is taken after
+    # the LLM calls so results_by_brand stays in timestamp order.
+    now_iso = _now().isoformat()
     
     # Create metric scores
     metric_scores = {}
-    for metric_name, score in metrics.items():
-        # Get detailed metric info from LLM
-        metric_details = getattr(llm_generator, f"generate_{metric_name}")(
-            request.brand_name,
-            request.industry,
-            request.additional_context
-        )
-        
+    for metric_name, details in metric_details.items():
         metric_scores[metric_name] = {
             "metric_name": metric_name,
-            "score": score,
-            "reasoning": metric_details["reasoning"],
-            "key_insights": metric_details["key_insights"],
-            "timestamp": datetime.now().isoformat()
+            "score": details["score"],
+            "reasoning": details["reasoning"],
+            "key_insights": details["key_insights"],
+            "timestamp": now_iso
         }
     
     # Create resonance result
-    result_id = str(uuid.uuid4())
+    result_id = new_id()
     result = {
         "id": result_id,
         "brand_id": brand_id,
@@ -225,75 +471,157 @@ async def analyze_brand(request: AnalysisRequest):
         "overall_score": overall_score,
         "category": category,
         "category_description": category_description,
-        "metrics": metric_scores,
-        "timestamp": datetime.now().isoformat(),
+        "metrics": MetricsBundle(**metric_scores).model_dump(mode="json"),
+        "timestamp": now_iso,
         "mode": request.mode
     }
     
-    resonance_results[result_id] = result
-    save_to_json(resonance_results, "resonance_results")
+    await store.set("resonance_results", result_id, result)
+    await store.append("results_by_brand", brand_id, result_id)
     
     # Generate and save additional analyses
-    await generate_additional_analyses(brand_id, request)
+    await generate_additional_analyses(brand_id, request, now_iso)
     
     return result
 
+# Approximate number of bytes buffered before a streamed chunk is sent
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# List bodies up to this size are buffered, cached and served compressed;
+# larger ones are streamed so memory use stays flat
+BUFFERED_LIST_MAX_SIZE = 1024 * 1024
+
+async def _stream_results(result_ids: Optional[List[str]], ndjson: bool):
+    """
+    Yield stored results as a JSON array, or as NDJSON lines, in batched chunks.
+    
+    All results are streamed when result_ids is None.
+    """
+    buffer = bytearray() if ndjson else bytearray(b"[")
+    first = True
+    async for raw in store.iter_raw("resonance_results", result_ids):
+        if ndjson:
+            buffer += raw
+            buffer += b"\n"
+        else:
+            if not first:
+                buffer += b","
+            buffer += raw
+        first = False
+        
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    
+    if not ndjson:
+        buffer += b"]"
+    if buffer:
+        yield bytes(buffer)
+
 @app.get("/results/", response_model=List[ResonanceResult])
-async def get_results(brand_id: Optional[str] = None):
-    """Get all resonance results, optionally filtered by brand ID."""
-    if brand_id:
-        filtered_results = [r for r in resonance_results.values() if r["brand_id"] == brand_id]
-        return filtered_results
-    return list(resonance_results.values())
+async def get_results(request: Request, brand_id: Optional[str] = None):
+    """
+    Get all resonance results, optionally filtered by brand ID.
+    
+    Results are streamed one record at a time instead of being validated and
+    encoded as a single list. Clients that send "Accept: application/x-ndjson"
+    receive one JSON object per line; everyone else gets a JSON array. An
+    array of at most BUFFERED_LIST_MAX_SIZE bytes is served from the response
+    cache instead, with an ETag and precompressed when the client accepts
+    Brotli or gzip.
+    """
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        result_ids = await store.get_list("results_by_brand", brand_id) if brand_id else None
+        return StreamingResponse(_stream_results(result_ids, ndjson=True), media_type="application/x-ndjson")
+    
+    # A brand's list depends on both stores: analyze_brand stores a result
+    # before appending its ID, so a list built in between must not outlive
+    # the append. The versions are read before the data, so a write racing
+    # with this request leaves an entry that the next request rebuilds.
+    version = (await store.version("resonance_results"), await store.version("results_by_brand"))
+    entry = _response_cache.get("resonance_results", ("list", brand_id), version)
+    if entry is not None:
+        return await cached_entry_response(request, entry)
+    
+    # Snapshot the IDs so results added while streaming don't break iteration
+    result_ids = await store.get_list("results_by_brand", brand_id) if brand_id else None
+    
+    # Read ahead until the array is complete or too large to buffer
+    chunks = _stream_results(result_ids, ndjson=False)
+    head = []
+    head_size = 0
+    async for chunk in chunks:
+        head.append(chunk)
+        head_size += len(chunk)
+        if head_size > BUFFERED_LIST_MAX_SIZE:
+            break
+    else:
+        entry = _response_cache.put("resonance_results", ("list", brand_id), version, b"".join(head))
+        return await cached_entry_response(request, entry)
+    
+    async def stream():
+        for chunk in head:
+            yield chunk
+        async for chunk in chunks:
+            yield chunk
+    
+    return StreamingResponse(stream(), media_type="application/json")
 
 @app.get("/results/{result_id}", response_model=ResonanceResult)
-async def get_result(result_id: str):
+async def get_result(request: Request, result_id: str):
     """Get a specific resonance result by ID."""
-    if result_id not in resonance_results:
-        raise HTTPException(status_code=404, detail="Result not found")
-    return resonance_results[result_id]
+    return await cached_json_response(
+        request, "resonance_results", result_id,
+        lambda: store.get_raw("resonance_results", result_id), "Result not found"
+    )
 
 @app.get("/topics/{brand_id}", response_model=TopicAnalysis)
-async def get_topic_analysis(brand_id: str):
+async def get_topic_analysis(request: Request, brand_id: str):
     """Get topic analysis for a brand."""
-    if brand_id not in topic_analyses:
-        raise HTTPException(status_code=404, detail="Topic analysis not found")
-    return topic_analyses[brand_id]
+    return await cached_json_response(
+        request, "topic_analyses", brand_id,
+        lambda: store.get_raw("topic_analyses", brand_id), "Topic analysis not found"
+    )
 
 @app.get("/sentiment/{brand_id}", response_model=SentimentDistribution)
-async def get_sentiment_analysis(brand_id: str):
+async def get_sentiment_analysis(request: Request, brand_id: str):
     """Get sentiment analysis for a brand."""
-    if brand_id not in sentiment_analyses:
-        raise HTTPException(status_code=404, detail="Sentiment analysis not found")
-    return sentiment_analyses[brand_id]
+    return await cached_json_response(
+        request, "sentiment_analyses", brand_id,
+        lambda: store.get_raw("sentiment_analyses", brand_id), "Sentiment analysis not found"
+    )
 
 @app.get("/advocacy/{brand_id}", response_model=AdvocacyAnalysis)
-async def get_advocacy_analysis(brand_id: str):
+async def get_advocacy_analysis(request: Request, brand_id: str):
     """Get advocacy analysis for a brand."""
-    if brand_id not in advocacy_analyses:
-        raise HTTPException(status_code=404, detail="Advocacy analysis not found")
-    return advocacy_analyses[brand_id]
+    return await cached_json_response(
+        request, "advocacy_analyses", brand_id,
+        lambda: store.get_raw("advocacy_analyses", brand_id), "Advocacy analysis not found"
+    )
 
 @app.get("/geographic/{brand_id}", response_model=GeographicSpread)
-async def get_geographic_spread(brand_id: str):
+async def get_geographic_spread(request: Request, brand_id: str):
     """Get geographic spread for a brand."""
-    if brand_id not in geographic_spreads:
-        raise HTTPException(status_code=404, detail="Geographic spread not found")
-    return geographic_spreads[brand_id]
+    return await cached_json_response(
+        request, "geographic_spreads", brand_id,
+        lambda: store.get_raw("geographic_spreads", brand_id), "Geographic spread not found"
+    )
 
 @app.get("/demographic/{brand_id}", response_model=DemographicSpread)
-async def get_demographic_spread(brand_id: str):
+async def get_demographic_spread(request: Request, brand_id: str):
     """Get demographic spread for a brand."""
-    if brand_id not in demographic_spreads:
-        raise HTTPException(status_code=404, detail="Demographic spread not found")
-    return demographic_spreads[brand_id]
+    return await cached_json_response(
+        request, "demographic_spreads", brand_id,
+        lambda: store.get_raw("demographic_spreads", brand_id), "Demographic spread not found"
+    )
 
 @app.get("/intent/{brand_id}", response_model=IntentAnalysis)
-async def get_intent_analysis(brand_id: str):
+async def get_intent_analysis(request: Request, brand_id: str):
     """Get intent analysis for a brand."""
-    if brand_id not in intent_analyses:
-        raise HTTPException(status_code=404, detail="Intent analysis not found")
-    return intent_analyses[brand_id]
+    return await cached_json_response(
+        request, "intent_analyses", brand_id,
+        lambda: store.get_raw("intent_analyses", brand_id), "Intent analysis not found"
+    )
 
 @app.post("/compare/", response_model=ComparisonResult)
 async def compare_brands(brand_ids: List[str]):
@@ -307,40 +635,43 @@ async def compare_brands(brand_ids: List[str]):
         raise HTTPException(status_code=400, detail="At least two brands are required for comparison")
     
     # Get the most recent result for each brand
+    brand_names = {}
     brand_results = {}
     for brand_id in brand_ids:
-        brand_results_list = [r for r in resonance_results.values() if r["brand_id"] == brand_id]
-        if not brand_results_list:
+        stored_brand = await store.get("brands", brand_id)
+        if stored_brand is None:
+            raise HTTPException(status_code=404, detail=f"Brand {brand_id} not found")
+        brand_names[brand_id] = stored_brand.name
+        
+        result_ids = await store.get_list("results_by_brand", brand_id)
+        if not result_ids:
             raise HTTPException(status_code=404, detail=f"No results found for brand {brand_id}")
         
-        # Sort by timestamp (most recent first)
-        brand_results_list.sort(key=lambda x: x["timestamp"], reverse=True)
-        brand_results[brand_id] = brand_results_list[0]
+        # Result IDs are kept in timestamp order, so the last is the most recent
+        brand_results[brand_id] = await store.get("resonance_results", result_ids[-1])
     
     # Create comparison result
-    brand_names = {brand_id: brands[brand_id]["name"] for brand_id in brand_ids}
     overall_scores = {brand_names[brand_id]: result["overall_score"] for brand_id, result in brand_results.items()}
     
     # Compare metrics
     metric_scores = {}
-    for metric_name in scorer.METRIC_WEIGHTS.keys():
+    for metric_name in METRIC_NAMES:
         metric_scores[metric_name] = {
-            brand_names[brand_id]: result["metrics"][metric_name]["score"] 
+            brand_names[brand_id]: result["metrics"][metric_name]["score"]
             for brand_id, result in brand_results.items()
         }
     
     # Create and save comparison result
-    comparison_id = str(uuid.uuid4())
+    comparison_id = new_id()
     comparison = {
         "id": comparison_id,
         "brands": list(brand_names.values()),
         "overall_scores": overall_scores,
         "metric_scores": metric_scores,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now().isoformat()
     }
     
-    comparison_results[comparison_id] = comparison
-    save_to_json(comparison_results, "comparison_results")
+    await store.set("comparison_results", comparison_id, comparison)
     
     return comparison
 
@@ -356,76 +687,32 @@ async def generate_report(config: ReportConfig):
     # For now, we'll just return a success message
     return {"message": "Report generated successfully", "config": config.dict()}
 
-async def generate_additional_analyses(brand_id: str, request: AnalysisRequest):
+async def generate_additional_analyses(brand_id: str, request: AnalysisRequest, now_iso: Optional[str] = None):
     """Generate and save additional analyses for a brand."""
-    # Topic analysis
-    topic_analysis = llm_generator.generate_topic_analysis(
-        request.brand_name,
-        request.industry,
-        request.additional_context
-    )
-    topic_analysis["brand_id"] = brand_id
-    topic_analysis["timestamp"] = datetime.now().isoformat()
-    topic_analyses[brand_id] = topic_analysis
-    
-    # Sentiment analysis
-    sentiment_analysis = llm_generator.generate_sentiment_analysis(
-        request.brand_name,
-        request.industry,
-        request.additional_context
-    )
-    sentiment_analysis["brand_id"] = brand_id
-    sentiment_analysis["timestamp"] = datetime.now().isoformat()
-    sentiment_analyses[brand_id] = sentiment_analysis
-    
-    # Advocacy analysis
-    advocacy_analysis = llm_generator.generate_advocacy_analysis(
-        request.brand_name,
-        request.industry,
-        request.additional_context
-    )
-    advocacy_analysis["brand_id"] = brand_id
-    advocacy_analysis["timestamp"] = datetime.now().isoformat()
-    advocacy_analyses[brand_id] = advocacy_analysis
-    
-    # Geographic spread
-    geographic_spread = llm_generator.generate_geographic_spread(
-        request.brand_name,
-        request.industry,
-        request.additional_context
-    )
-    geographic_spread["brand_id"] = brand_id
-    geographic_spread["timestamp"] = datetime.now().isoformat()
-    geographic_spreads[brand_id] = geographic_spread
-    
-    # Demographic spread
-    demographic_spread = llm_generator.generate_demographic_spread(
-        request.brand_name,
-        request.industry,
-        request.additional_context
-    )
-    demographic_spread["brand_id"] = brand_id
-    demographic_spread["timestamp"] = datetime.now().isoformat()
-    demographic_spreads[brand_id] = demographic_spread
-    
-    # Intent analysis
-    intent_analysis = llm_generator.generate_intent_analysis(
-        request.brand_name,
-        request.industry,
-        request.additional_context
-    )
-    intent_analysis["brand_id"] = brand_id
-    intent_analysis["timestamp"] = datetime.now().isoformat()
-    intent_analyses[brand_id] = intent_analysis
+    if now_iso is None:
+        now_iso = _now().isoformat()
+    
+    # Each analysis is an independent LLM call, so run them concurrently
+    results = await asyncio.gather(*[
+        generate(analysis_name, request) for analysis_name in ANALYSIS_NAMES
+    ])
     
     # Save all analyses
-    save_to_json(topic_analyses, "topic_analyses")
-    save_to_json(sentiment_analyses, "sentiment_analyses")
-    save_to_json(advocacy_analyses, "advocacy_analyses")
-    save_to_json(geographic_spreads, "geographic_spreads")
-    save_to_json(demographic_spreads, "demographic_spreads")
-    save_to_json(intent_analyses, "intent_analyses")
+    for analysis_name, analysis in zip(ANALYSIS_NAMES, results):
+        analysis["brand_id"] = brand_id
+        analysis["timestamp"] = now_iso
+        await store.set(ANALYSIS_STORE_NAMES[analysis_name], brand_id, analysis)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # In-memory stores are per-process, so only scale out when Redis is shared
+    default_workers = (os.cpu_count() or 1) if REDIS_URL else 1
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("API_WORKERS", str(default_workers))),
+        loop="uvloop",
+        http="httptools",
+        log_level="warning"
+    )
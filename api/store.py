@@ -0,0 +1,379 @@
+"""
+Storage backends for the Brand Resonance API.
+
+Data is organised as named hashes of JSON documents (brands,
+resonance_results, ...) plus named lists (results_by_brand). MemoryStore
+keeps everything in process memory and persists hashes to JSON files in the
+data directory. RedisStore keeps them in Redis so that several API workers
+share one consistent state.
+"""
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Type
+import os
+import asyncio
+import tempfile
+
+import orjson
+from pydantic import BaseModel
+import redis.asyncio as redis
+
+
+def orjson_default(obj: Any) -> Any:
+    """Serialize objects orjson does not support natively, such as stored Pydantic models."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize a stored document or API response body with orjson."""
+    return orjson.dumps(
+        obj,
+        default=orjson_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+    )
+
+
+class Store:
+    """
+    Interface shared by the storage backends.
+
+    Every mutation bumps a per-name version counter, which callers use to key
+    caches of data derived from a hash or list.
+    """
+
+    async def start(self) -> None:
+        """Open connections and load persisted data."""
+
+    async def close(self) -> None:
+        """Persist outstanding data and release resources."""
+
+    async def get(self, name: str, key: str) -> Optional[Any]:
+        """Get a document from a hash, or None if it is missing."""
+        raise NotImplementedError
+
+    async def get_raw(self, name: str, key: str) -> Optional[bytes]:
+        """Get a document from a hash as serialized JSON, or None if it is missing."""
+        raise NotImplementedError
+
+    async def set(self, name: str, key: str, value: Any) -> None:
+        """Store a document in a hash."""
+        raise NotImplementedError
+
+    async def setdefault(self, name: str, key: str, value: Any) -> bool:
+        """Store a document unless the key exists; return whether it was stored."""
+        raise NotImplementedError
+
+    async def delete(self, name: str, key: str) -> bool:
+        """Delete a document from a hash; return whether it existed."""
+        raise NotImplementedError
+
+    async def contains(self, name: str, key: str) -> bool:
+        """Check whether a hash contains a key."""
+        raise NotImplementedError
+
+    async def items(self, name: str) -> AsyncIterator[Tuple[str, Any]]:
+        """Iterate over the (key, document) pairs of a hash."""
+        raise NotImplementedError
+        yield
+
+    async def iter_raw(self, name: str, keys: Optional[Iterable[str]] = None) -> AsyncIterator[bytes]:
+        """Iterate over serialized documents of a hash, optionally only the given keys."""
+        raise NotImplementedError
+        yield
+
+    async def append(self, name: str, key: str, item: str) -> None:
+        """Append an item to a list."""
+        raise NotImplementedError
+
+    async def get_list(self, name: str, key: str) -> List[str]:
+        """Get all items of a list, in insertion order."""
+        raise NotImplementedError
+
+    async def version(self, name: str) -> int:
+        """Get the mutation counter of a hash or list."""
+        raise NotImplementedError
+
+
+class MemoryStore(Store):
+    """
+    Store backed by process memory and JSON files.
+
+    Mutations only mark a hash dirty; a background task writes dirty hashes
+    every flush_interval seconds so bursts of mutations coalesce into one
+    write. Files are replaced atomically, so a crash mid-write leaves the
+    previous version intact. Hashes not listed in persisted live in memory
+    only.
+    """
+
+    def __init__(
+        self,
+        persisted: Iterable[str],
+        models: Optional[Dict[str, Type[BaseModel]]] = None,
+        data_dir: str = "data",
+        flush_interval: float = 2.0
+    ):
+        self.persisted = tuple(persisted)
+        self.models = models or {}
+        self.data_dir = data_dir
+        self.flush_interval = flush_interval
+        self._hashes: Dict[str, Dict[str, Any]] = {}
+        self._lists: Dict[str, Dict[str, List[str]]] = {}
+        self._versions: Dict[str, int] = {}
+        self._dirty = set()
+        self._flusher_task = None
+        self._closing = None
+
+    def _hash(self, name: str) -> Dict[str, Any]:
+        return self._hashes.setdefault(name, {})
+
+    def _mark_dirty(self, name: str):
+        """Record a mutation and schedule the hash for the next flush."""
+        self._versions[name] = self._versions.get(name, 0) + 1
+        if name in self.persisted:
+            self._dirty.add(name)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.data_dir, f"{name}.json")
+
+    def _write_payload(self, payload: bytes, name: str):
+        """Atomically replace a JSON file in the data directory with pre-serialized data."""
+        os.makedirs(self.data_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.data_dir, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._path(name))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _load(self, name: str) -> Dict[str, Any]:
+        """
+        Load a hash from its JSON file in the data directory.
+        
+        Raises:
+            ValueError: If the file is not valid JSON; it is left untouched
+                rather than overwritten with an empty hash on the next write
+        """
+        path = self._path(name)
+        try:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Corrupt data file {path}: {e}") from e
+
+        # Validate modelled documents once here so stored datetimes are parsed
+        model = self.models.get(name)
+        if model:
+            data = {key: model.model_validate(value) for key, value in data.items()}
+        return data
+
+    async def flush(self):
+        """Write every dirty hash to disk without blocking the event loop."""
+        for name in list(self._dirty):
+            # Clear the flag before writing so mutations made while the file
+            # is being written are picked up by the next flush.
+            self._dirty.discard(name)
+            payload = dumps(self._hash(name))
+            try:
+                await asyncio.to_thread(self._write_payload, payload, name)
+            except Exception:
+                self._dirty.add(name)
+                raise
+
+    async def _flusher(self):
+        """Flush dirty hashes every flush_interval seconds, and once more when closing."""
+        closing = False
+        while not closing:
+            try:
+                await asyncio.wait_for(self._closing.wait(), self.flush_interval)
+                closing = True
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"Error flushing data: {e}")
+
+    async def start(self) -> None:
+        for name in self.persisted:
+            self._hash(name).update(self._load(name))
+        # Created here so the event belongs to the server's event loop
+        self._closing = asyncio.Event()
+        self._flusher_task = asyncio.create_task(self._flusher())
+
+    async def close(self) -> None:
+        # Let the flusher finish rather than cancelling it: a cancelled flush
+        # would leave its write thread running alongside the one below
+        if self._flusher_task:
+            self._closing.set()
+            await self._flusher_task
+            self._flusher_task = None
+
+        # Retry anything the flusher failed to write, raising on failure
+        await self.flush()
+
+    async def get(self, name: str, key: str) -> Optional[Any]:
+        return self._hash(name).get(key)
+
+    async def get_raw(self, name: str, key: str) -> Optional[bytes]:
+        value = self._hash(name).get(key)
+        return None if value is None else dumps(value)
+
+    async def set(self, name: str, key: str, value: Any) -> None:
+        self._hash(name)[key] = value
+        self._mark_dirty(name)
+
+    async def setdefault(self, name: str, key: str, value: Any) -> bool:
+        data = self._hash(name)
+        if key in data:
+            return False
+        data[key] = value
+        self._mark_dirty(name)
+        return True
+
+    async def delete(self, name: str, key: str) -> bool:
+        data = self._hash(name)
+        if key not in data:
+            return False
+        del data[key]
+        self._mark_dirty(name)
+        return True
+
+    async def contains(self, name: str, key: str) -> bool:
+        return key in self._hash(name)
+
+    async def items(self, name: str) -> AsyncIterator[Tuple[str, Any]]:
+        # Snapshot so callers may mutate the hash while iterating
+        for item in list(self._hash(name).items()):
+            yield item
+
+    async def iter_raw(self, name: str, keys: Optional[Iterable[str]] = None) -> AsyncIterator[bytes]:
+        data = self._hash(name)
+        for key in list(data) if keys is None else keys:
+            value = data.get(key)
+            if value is not None:
+                yield dumps(value)
+
+    async def append(self, name: str, key: str, item: str) -> None:
+        self._lists.setdefault(name, {}).setdefault(key, []).append(item)
+        self._versions[name] = self._versions.get(name, 0) + 1
+
+    async def get_list(self, name: str, key: str) -> List[str]:
+        return list(self._lists.get(name, {}).get(key, []))
+
+    async def version(self, name: str) -> int:
+        return self._versions.get(name, 0)
+
+
+class RedisStore(Store):
+    """
+    Store backed by Redis.
+
+    Hashes map to Redis hashes of orjson-encoded documents and lists to Redis
+    lists, so every worker process sees the same data. Durability is left to Redis persistence (AOF/RDB).
+    """
+
+    # Number of keys fetched per HMGET when iterating selected documents
+    BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        url: str,
+        models: Optional[Dict[str, Type[BaseModel]]] = None,
+        prefix: str = "resonance:"
+    ):
+        self.models = models or {}
+        self.url = url
+        self.prefix = prefix
+        self._redis = None
+
+    def _key(self, name: str) -> str:
+        return f"{self.prefix}{name}"
+
+    def _list_key(self, name: str, key: str) -> str:
+        return f"{self.prefix}{name}:{key}"
+
+    def _version_key(self, name: str) -> str:
+        return f"{self.prefix}version:{name}"
+
+    def _decode(self, name: str, raw: bytes) -> Any:
+        model = self.models.get(name)
+        if model:
+            return model.model_validate_json(raw)
+        return orjson.loads(raw)
+
+    async def start(self) -> None:
+        # Connect here rather than in __init__ so the connection pool belongs
+        # to the server's event loop
+        self._redis = redis.from_url(self.url)
+        await self._redis.ping()
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    async def get(self, name: str, key: str) -> Optional[Any]:
+        raw = await self._redis.hget(self._key(name), key)
+        return None if raw is None else self._decode(name, raw)
+
+    async def get_raw(self, name: str, key: str) -> Optional[bytes]:
+        return await self._redis.hget(self._key(name), key)
+
+    async def set(self, name: str, key: str, value: Any) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(name), key, dumps(value))
+            pipe.incr(self._version_key(name))
+            await pipe.execute()
+
+    async def setdefault(self, name: str, key: str, value: Any) -> bool:
+        added = await self._redis.hsetnx(self._key(name), key, dumps(value))
+        # Like MemoryStore, only count mutations that happened. The bump
+        # follows the write, so a cache built in between is merely rebuilt.
+        if added:
+            await self._redis.incr(self._version_key(name))
+        return bool(added)
+
+    async def delete(self, name: str, key: str) -> bool:
+        deleted = await self._redis.hdel(self._key(name), key)
+        if deleted:
+            await self._redis.incr(self._version_key(name))
+        return bool(deleted)
+
+    async def contains(self, name: str, key: str) -> bool:
+        return bool(await self._redis.hexists(self._key(name), key))
+
+    async def items(self, name: str) -> AsyncIterator[Tuple[str, Any]]:
+        async for key, raw in self._redis.hscan_iter(self._key(name)):
+            yield key.decode(), self._decode(name, raw)
+
+    async def iter_raw(self, name: str, keys: Optional[Iterable[str]] = None) -> AsyncIterator[bytes]:
+        if keys is None:
+            async for _, raw in self._redis.hscan_iter(self._key(name)):
+                yield raw
+            return
+
+        keys = list(keys)
+        for start in range(0, len(keys), self.BATCH_SIZE):
+            values = await self._redis.hmget(self._key(name), keys[start:start + self.BATCH_SIZE])
+            for raw in values:
+                if raw is not None:
+                    yield raw
+
+    async def append(self, name: str, key: str, item: str) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(self._list_key(name, key), item)
+            pipe.incr(self._version_key(name))
+            await pipe.execute()
+
+    async def get_list(self, name: str, key: str) -> List[str]:
+        items = await self._redis.lrange(self._list_key(name, key), 0, -1)
+        return [item.decode() for item in items]
+
+    async def version(self, name: str) -> int:
+        return int(await self._redis.get(self._version_key(name)) or 0)
@@ -14,29 +14,46 @@ import atexit
 backend_process = None
 frontend_process = None
 
+# Use the project virtual environment's interpreter when there is one
+VENV_PYTHON = os.path.join("venv", "bin", "python3")
+
+def stop_process(process):
+    """Stop a server and the process group it leads."""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
 def cleanup():
     """Clean up processes on exit."""
+    global backend_process, frontend_process
+    
     if backend_process:
         print("Stopping backend server...")
-        os.killpg(os.getpgid(backend_process.pid), signal.SIGTERM)
+        stop_process(backend_process)
+        backend_process = None
     
     if frontend_process:
         print("Stopping frontend server...")
-        os.killpg(os.getpgid(frontend_process.pid), signal.SIGTERM)
+        stop_process(frontend_process)
+        frontend_process = None
+
+def handle_sigterm(signum, frame):
+    """Treat SIGTERM like Ctrl+C so the servers are stopped on the way out."""
+    raise KeyboardInterrupt
 
 def start_backend():
     """Start the backend server."""
     global backend_process
     print("Starting backend server...")
     
-    # Activate virtual environment and start backend
+    # Start backend with the virtual environment's interpreter, in its own
+    # session so it can be stopped as a group. Output goes straight to our
+    # terminal; an unread pipe would fill up and block the server.
+    python = VENV_PYTHON if os.path.exists(VENV_PYTHON) else sys.executable
     backend_process = subprocess.Popen(
-        "source venv/bin/activate && python3 run.py --api-only",
-        shell=True,
-        preexec_fn=os.setsid,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        universal_newlines=True
+        [python, "run.py", "--api-only"],
+        start_new_session=True
     )
     
     # Wait for backend to start
@@ -51,12 +68,9 @@ def start_frontend():
     
     # Start frontend
     frontend_process = subprocess.Popen(
-        "cd frontend && npm start",
-        shell=True,
-        preexec_fn=os.setsid,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        universal_newlines=True
+        ["npm", "start"],
+        cwd="frontend",
+        start_new_session=True
     )
     
     # Wait for frontend to start
@@ -66,15 +80,16 @@ def start_frontend():
 
 def main():
     """Main entry point."""
-    # Register cleanup handler
+    # Register cleanup handlers
     atexit.register(cleanup)
+    signal.signal(signal.SIGTERM, handle_sigterm)
     
     try:
         # Start backend
-        backend_proc = start_backend()
+        start_backend()
         
         # Start frontend
-        frontend_proc = start_frontend()
+        start_frontend()
         
         # Monitor processes
         print("\nBrand Resonance App is running!")
@@ -82,18 +97,17 @@ def main():
         print("Frontend: http://localhost:3000")
         print("\nPress Ctrl+C to stop the servers.\n")
         
-        # Keep the script running
+        # Block until a server exits, then restart it. The signal handlers
+        # raise, so Ctrl+C and SIGTERM still break out of waitpid.
         while True:
-            # Check if processes are still running
-            if backend_proc.poll() is not None:
-                print("Backend server stopped unexpectedly. Restarting...")
-                backend_proc = start_backend()
+            pid, _ = os.waitpid(-1, 0)
             
-            if frontend_proc.poll() is not None:
+            if backend_process and pid == backend_process.pid:
+                print("Backend server stopped unexpectedly. Restarting...")
+                start_backend()
+            elif frontend_process and pid == frontend_process.pid:
                 print("Frontend server stopped unexpectedly. Restarting...")
-                frontend_proc = start_frontend()
-            
-            time.sleep(1)
+                start_frontend()
     
     except KeyboardInterrupt:
         print("\nStopping servers...")
@@ -2,9 +2,11 @@
 Data models for the brand resonance application.
 """
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 from datetime import datetime
 
+from models.scoring_engine import ResonanceScorer
+
 
 class Brand(BaseModel):
     """Model representing a brand."""
@@ -27,6 +29,15 @@ class MetricScore(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+# Model with one MetricScore field per scored metric. The metric set is fixed,
+# so a typed field per metric validates faster than an open Dict[str, MetricScore].
+MetricsBundle = create_model(
+    "MetricsBundle",
+    __module__=__name__,
+    **{metric_name: (MetricScore, ...) for metric_name in ResonanceScorer.METRIC_WEIGHTS}
+)
+
+
 class ResonanceResult(BaseModel):
     """Model representing the complete resonance analysis result for a brand."""
     id: Optional[str] = None
@@ -35,7 +46,7 @@ class ResonanceResult(BaseModel):
     overall_score: float
     category: str
     category_description: str
-    metrics: Dict[str, MetricScore]
+    metrics: MetricsBundle
     timestamp: datetime = Field(default_factory=datetime.now)
     mode: str = "ai"  # "ai" or "hybrid"
 
@@ -1,32 +1,309 @@
 """
 LLM integration module for generating brand resonance metrics using language models.
 """
-from typing import Dict, List, Optional, Any
-import json
+from typing import Dict, List, Optional, Any, AsyncIterator, Awaitable, Callable, Iterable, NamedTuple, Sequence, Tuple, Type, TypeVar
+from typing import Annotated
 import os
-from langchain.llms import OpenAI
-from langchain.chat_models import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
-from langchain.output_parsers import PydanticOutputParser
-from pydantic import BaseModel, Field, validator
+import asyncio
+import copy
+import functools
+import hashlib
+import random
+import sys
+import time
+import weakref
+from collections import OrderedDict
+import httpx
+import openai
+from pydantic import BaseModel, Field, create_model
 import numpy as np
+import orjson
+import jiter
 from dotenv import load_dotenv
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 # Load environment variables
 load_dotenv()
 
+T = TypeVar("T")
+
+# Maximum number of LLM requests in flight at once per event loop
+MAX_CONCURRENT_REQUESTS = 5
+
+# Attempts per LLM request when rate limited, and the first backoff in seconds
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+
+# Model used for each metric and analysis. Scoring a well-defined metric is
+# handled well by a small model; advocacy is the most nuanced judgement, so
+# it gets the larger one. Metrics routed to the same model share one call.
+DEFAULT_MODEL_ROUTING: Dict[str, str] = {
+    "conversational_depth": "gpt-4o-mini",
+    "community_spread": "gpt-4o-mini",
+    "emotional_intensity": "gpt-4o-mini",
+    "intent_signals": "gpt-4o-mini",
+    "advocacy_language": "gpt-4o",
+    "topic_analysis": "gpt-4o-mini",
+    "sentiment_analysis": "gpt-4o-mini",
+    "advocacy_analysis": "gpt-4o",
+    "geographic_spread": "gpt-4o-mini",
+    "demographic_spread": "gpt-4o-mini",
+    "intent_analysis": "gpt-4o-mini",
+}
+
+# Connection pool limits and timeouts (seconds) of the OpenAI HTTP client
+HTTP_MAX_CONNECTIONS = 50
+HTTP_MAX_KEEPALIVE = 20
+HTTP_TIMEOUT = 60.0
+HTTP_CONNECT_TIMEOUT = 5.0
+
+# Size limit (bytes) and expiry (seconds) of the on-disk LLM result cache
+DISK_CACHE_SIZE_LIMIT = 2 ** 30
+DISK_CACHE_EXPIRE = 7 * 24 * 60 * 60
+
+# Seconds between status checks of an offline Batch API job
+BATCH_POLL_INTERVAL = 30.0
+
+# Guidance shared by every analysis prompt. It opens the static system
+# message, so it is a common prefix of every analysis request.
+ANALYST_GUIDELINES = """
+        General guidelines for every analysis:
+        - Base your assessment on what is publicly known about the brand, its products or services, its
+          competitors, and the typical behavior of consumers in its industry.
+        - Treat the additional context supplied by the user as authoritative where it conflicts with your
+          general knowledge, but do not invent facts that neither source supports.
+        - Consider the brand's market position, its size and maturity, the channels its customers use,
+          and recent developments that are likely to shape how people talk about it.
+        - Distinguish between volume of conversation and quality of conversation; a frequently mentioned
+          brand does not automatically resonate deeply, and a niche brand may inspire intense loyalty.
+        - Weigh both positive and negative signals. Strong criticism can indicate engagement, while
+          indifference usually indicates weak resonance.
+        - Compare the brand against realistic peers in the same industry rather than against the largest
+          brands in the world, unless the brand itself is one of them.
+        - Use the full range of any scale you are asked for. Reserve the extremes for brands that clearly
+          stand out, place typical brands near the middle, and avoid clustering every score around the
+          same value.
+        - When estimating percentages or distributions, make sure the values are plausible for the brand
+          and that parts of a whole add up to approximately 100.
+        - Be specific in reasoning and insights: refer to concrete products, audiences, platforms,
+          campaigns, or behaviors instead of generic statements that would apply to any brand.
+        - Keep reasoning concise and focused on the factors that most influenced your assessment, and
+          keep each insight or phrase short enough to be shown in a dashboard.
+        - Account for differences between regions, age groups, and customer segments when they matter for
+          the brand, instead of describing its audience as a single homogeneous group.
+        - Separate the brand's own marketing voice from what consumers say about it; only consumer
+          conversation, reviews, recommendations, and community discussion count as resonance.
+        - Consider how conversation about the brand differs between platforms such as review sites,
+          forums, social networks, video platforms, and news coverage, and which of them matter most in
+          its industry.
+        - Take the purchase cycle of the industry into account: frequently bought products generate
+          different conversation and intent patterns than rare, considered, or high-value purchases.
+        - Keep names of categories, regions, and groups consistent and human readable, using title case
+          and avoiding abbreviations that a business reader might not recognize.
+        - If information about the brand is limited, produce your best realistic estimate for a brand of
+          its kind in its industry and say so briefly in the reasoning.
+        - Respond only with the requested output format, without any text before or after it.
+"""
+
+# Per-request part of every prompt, sent as the user message after the static system message
+HUMAN_TEMPLATE = """Brand: {brand_name}
+Industry: {industry}
+Additional context: {additional_context}"""
+
+# Definition of each resonance metric, in scoring order
+METRIC_DEFINITIONS: Dict[str, str] = {
+    "conversational_depth": """
+        Conversational Depth measures how substantive and meaningful conversations about a brand are.
+        High conversational depth indicates that people engage in detailed, thoughtful discussions about the brand,
+        while low depth suggests superficial mentions without meaningful engagement.
+        
+        Consider factors like:
+        - Length and detail of typical brand mentions
+        - Complexity and sophistication of discussions
+        - Presence of specific product/service details in conversations
+        - Whether conversations go beyond surface-level comments
+        - Depth of knowledge demonstrated in brand discussions
+""",
+    "community_spread": """
+        Community Spread measures how widely a brand is discussed across different communities, platforms, and demographic groups.
+        High community spread indicates that the brand has penetrated diverse communities and audiences,
+        while low spread suggests the brand is only discussed within limited or niche groups.
+        
+        Consider factors like:
+        - Diversity of platforms where the brand is discussed
+        - Variety of demographic groups engaging with the brand
+        - Geographic spread of brand conversations
+        - Presence across different interest communities
+        - Cross-cultural relevance
+""",
+    "emotional_intensity": """
+        Emotional Intensity measures the strength of emotional reactions and connections people have with a brand.
+        High emotional intensity indicates strong emotional responses (positive or negative),
+        while low intensity suggests emotional indifference or weak connections.
+        
+        Consider factors like:
+        - Use of emotional language in brand discussions
+        - Presence of strong sentiment (positive or negative)
+        - Personal stories or experiences shared about the brand
+        - Expressions of brand loyalty or attachment
+        - Emotional responses to brand actions or communications
+""",
+    "intent_signals": """
+        Intent Signals measures indications of purchase intent or consideration in brand conversations.
+        High intent signals indicate strong purchase consideration and active buying signals,
+        while low signals suggest minimal purchase interest or consideration.
+        
+        Consider factors like:
+        - Expressions of desire to purchase or try products/services
+        - Questions about pricing, availability, or features
+        - Comparisons with competitor products/services
+        - Discussions about purchase experiences
+        - Pre-purchase research conversations
+        - Post-purchase intent to repurchase
+""",
+    "advocacy_language": """
+        Advocacy Language measures how strongly people recommend or advocate for a brand to others.
+        High advocacy language indicates strong recommendations and brand championing,
+        while low advocacy suggests minimal or negative recommendations.
+        
+        Consider factors like:
+        - Explicit recommendations to others
+        - Defending the brand against criticism
+        - Sharing positive experiences unprompted
+        - Word-of-mouth promotion language
+        - Expressions of brand loyalty and commitment
+        - Willingness to be associated with the brand
+""",
+}
+METRIC_NAMES: Tuple[str, ...] = tuple(METRIC_DEFINITIONS)
+
+
+def metrics_system_prompt(metric_names: Sequence[str]) -> str:
+    """Build the static system prompt that scores the given metrics in one call."""
+    definitions = "        \n".join(
+        f"        {number}. {name} ({name.replace('_', ' ').title()})\n        {METRIC_DEFINITIONS[name]}"
+        for number, name in enumerate(metric_names, 1)
+    )
+    return f"""
+        You are an expert brand analyst with deep knowledge of consumer behavior, brand conversations and communities,
+        consumer psychology, purchase behavior, and brand advocacy.
+        
+        Analyze the following resonance metrics for the brand described in the user message.
+        
+{definitions}        
+        Based on your expert knowledge and the information provided, generate for each metric:
+        1. A score from 0-100
+        2. Reasoning for this score
+        3. Key insights that contributed to this score
+        
+        Return a single JSON object with one entry per metric, keyed by the metric names above.
+        """
+
+# Static system prompt of each analysis, keyed by analysis name
+SYSTEM_PROMPTS: Dict[str, str] = {
+    "topic_analysis": """
+        You are an expert brand analyst specializing in conversation analysis and topic modeling.
+        
+        Analyze the likely conversation topics for the brand described in the user message.
+        
+        Generate a realistic topic analysis that identifies the main topics discussed in relation to this brand.
+        For each topic, provide:
+        - Topic name
+        - Prevalence (percentage of conversations)
+        - Key terms associated with this topic
+        - Sample phrases that would appear in this topic
+        
+        The topics should be realistic and specific to the brand and industry.
+        """,
+    "sentiment_analysis": """
+        You are an expert brand analyst specializing in sentiment analysis and emotional response.
+        
+        Analyze the likely sentiment distribution for the brand described in the user message.
+        
+        Generate a realistic sentiment distribution that shows how sentiment is distributed in conversations about this brand.
+        Provide the percentage breakdown across these sentiment categories:
+        - Very Positive
+        - Positive
+        - Neutral
+        - Negative
+        - Very Negative
+        
+        The distribution should be realistic and specific to the brand and industry.
+        """,
+    "advocacy_analysis": """
+        You are an expert brand analyst specializing in brand advocacy and consumer recommendations.
+        
+        Analyze the likely advocacy patterns for the brand described in the user message.
+        
+        Generate a realistic advocacy analysis that shows:
+        - Overall advocacy strength (0-100)
+        - Percentage of brand advocates among those discussing the brand
+        - Key phrases commonly used by brand advocates
+        
+        The analysis should be realistic and specific to the brand and industry.
+        """,
+    "geographic_spread": """
+        You are an expert brand analyst specializing in global brand presence and regional analysis.
+        
+        Analyze the likely geographic spread for the brand described in the user message.
+        
+        Generate a realistic geographic distribution that shows how brand conversations are distributed across different regions.
+        Provide the percentage breakdown across major regions (e.g., North America, Europe, Asia, etc.).
+        
+        The distribution should be realistic and specific to the brand and industry.
+        """,
+    "demographic_spread": """
+        You are an expert brand analyst specializing in consumer demographics and audience segmentation.
+        
+        Analyze the likely demographic spread for the brand described in the user message.
+        
+        Generate a realistic demographic distribution that shows how brand conversations are distributed across:
+        - Age groups (e.g., 18-24, 25-34, 35-44, etc.)
+        - Gender
+        - Income levels
+        
+        The distribution should be realistic and specific to the brand and industry.
+        """,
+    "intent_analysis": """
+        You are an expert brand analyst specializing in consumer purchase behavior and intent signals.
+        
+        Analyze the likely intent signals for the brand described in the user message.
+        
+        Generate a realistic intent signal analysis that shows the distribution across intent categories:
+        - Awareness (just learning about the brand)
+        - Consideration (actively researching or comparing)
+        - Conversion (ready to purchase or has purchased)
+        
+        For each category, provide key phrases that would indicate this intent level.
+        
+        The analysis should be realistic and specific to the brand and industry.
+        """,
+}
+
 class MetricResult(BaseModel):
     """Pydantic model for metric results."""
     score: float = Field(..., description="Numeric score between 0 and 100")
     reasoning: str = Field(..., description="Explanation for the score")
     key_insights: List[str] = Field(..., description="Key insights that contributed to the score")
-    
-    @validator('score')
-    def score_must_be_in_range(cls, v):
-        if v < 0 or v > 100:
-            raise ValueError(f'Score must be between 0 and 100, got {v}')
-        return v
+
+class MetricGroupResult(BaseModel):
+    """Base of models holding the results of several metrics, keyed by metric name."""
+
+class AllMetricsResult(MetricGroupResult):
+    """Pydantic model for the results of all five metrics from one batched call."""
+    conversational_depth: MetricResult = Field(..., description="Conversational Depth result")
+    community_spread: MetricResult = Field(..., description="Community Spread result")
+    emotional_intensity: MetricResult = Field(..., description="Emotional Intensity result")
+    intent_signals: MetricResult = Field(..., description="Intent Signals result")
+    advocacy_language: MetricResult = Field(..., description="Advocacy Language result")
 
 class TopicAnalysis(BaseModel):
     """Pydantic model for topic analysis results."""
@@ -58,361 +335,615 @@ class IntentAnalysis(BaseModel):
     key_phrases: Dict[str, List[str]] = Field(..., description="Key phrases for each intent category")
 
 
-class LLMMetricGenerator:
+# msgspec mirrors of the models above, used to decode and validate LLM output
+# much faster than Pydantic when msgspec is installed
+_STRUCTS: Dict[Type[BaseModel], Any] = {}
+
+if msgspec is not None:
+    class MetricResultStruct(msgspec.Struct):
+        score: Annotated[float, msgspec.Meta(ge=0, le=100)]
+        reasoning: str
+        key_insights: List[str]
+    
+    class AllMetricsResultStruct(msgspec.Struct):
+        conversational_depth: MetricResultStruct
+        community_spread: MetricResultStruct
+        emotional_intensity: MetricResultStruct
+        intent_signals: MetricResultStruct
+        advocacy_language: MetricResultStruct
+    
+    class TopicAnalysisStruct(msgspec.Struct):
+        topics: List[Dict[str, Any]]
+    
+    class SentimentAnalysisStruct(msgspec.Struct):
+        distribution: Dict[str, float]
+    
+    class AdvocacyAnalysisStruct(msgspec.Struct):
+        strength: float
+        advocates_percentage: float
+        key_advocacy_phrases: List[str]
+    
+    class GeographicSpreadStruct(msgspec.Struct):
+        regions: Dict[str, float]
+    
+    class DemographicSpreadStruct(msgspec.Struct):
+        age_groups: Dict[str, float]
+        gender: Dict[str, float]
+        income_levels: Dict[str, float]
+    
+    class IntentAnalysisStruct(msgspec.Struct):
+        categories: Dict[str, float]
+        key_phrases: Dict[str, List[str]]
+    
+    _STRUCTS.update({
+        MetricResult: MetricResultStruct,
+        AllMetricsResult: AllMetricsResultStruct,
+        TopicAnalysis: TopicAnalysisStruct,
+        SentimentAnalysis: SentimentAnalysisStruct,
+        AdvocacyAnalysis: AdvocacyAnalysisStruct,
+        GeographicSpread: GeographicSpreadStruct,
+        DemographicSpread: DemographicSpreadStruct,
+        IntentAnalysis: IntentAnalysisStruct,
+    })
+
+
+def check_score(result: Dict[str, Any]):
+    """Raise ValueError unless a metric result's score is a number between 0 and 100."""
+    score = result["score"]
+    if isinstance(score, bool) or not isinstance(score, (int, float)):
+        raise ValueError(f"Score must be a number, got {score!r}")
+    if not 0 <= score <= 100:
+        raise ValueError(f"Score must be between 0 and 100, got {score}")
+
+
+def object_validator(model: Type[BaseModel]) -> Callable[[Any], Dict[str, Any]]:
     """
-    Generates brand resonance metrics using large language models.
+    Build a function that validates already-parsed JSON data as a model.
+    
+    Applies the same checks as json_decoder, for data parsed by other means
+    such as partial parses of a streamed response.
+    
+    Args:
+        model: Model describing the expected data
+        
+    Returns:
+        Callable: Function turning the data into a validated plain dictionary
+    """
+    struct = _STRUCTS.get(model)
+    if struct is not None:
+        return lambda data: msgspec.to_builtins(msgspec.convert(data, struct))
+    
+    def validate(data: Any) -> Dict[str, Any]:
+        if model is MetricResult:
+            check_score(data)
+        elif issubclass(model, MetricGroupResult):
+            for result in data.values():
+                check_score(result)
+        return data
+    return validate
+
+
+def json_decoder(model: Type[BaseModel]) -> Callable[[str], Dict[str, Any]]:
     """
+    Build a function that decodes and validates a JSON LLM response as a model.
     
-    def __init__(self, model_name: str = "gpt-4", temperature: float = 0.2):
+    Uses the model's msgspec mirror when msgspec is installed. Otherwise the
+    response is decoded with orjson and trusted to follow the schema from the
+    prompt, apart from an explicit range check on scores; full Pydantic
+    validation is skipped.
+    
+    Args:
+        model: Model describing the expected response
+        
+    Returns:
+        Callable: Function turning the raw response into a plain dictionary
+    """
+    struct = _STRUCTS.get(model)
+    if struct is not None:
+        decoder = msgspec.json.Decoder(struct)
+        return lambda raw: msgspec.to_builtins(decoder.decode(raw))
+    
+    validate = object_validator(model)
+    return lambda raw: validate(orjson.loads(raw))
+
+
+# Validates each metric parsed early from a streamed response
+validate_metric_result = object_validator(MetricResult)
+
+
+@functools.lru_cache(maxsize=None)
+def format_instructions(model: Type[BaseModel]) -> str:
+    """
+    Describe the JSON object an LLM response must consist of.
+    
+    Serializing the schema is not free, so the result is computed once per
+    model and interned; every prompt for the model then embeds the very same
+    string, byte for byte, in every process.
+    """
+    schema = orjson.dumps(model.model_json_schema()).decode()
+    return sys.intern(f"Return ONLY a JSON object, with no other text, that conforms to this JSON schema:\n{schema}")
+
+
+@functools.lru_cache(maxsize=None)
+def metrics_response_model(metric_names: Tuple[str, ...]) -> Type[MetricGroupResult]:
+    """Get the model of a response holding results for the given metrics."""
+    if metric_names == METRIC_NAMES:
+        return AllMetricsResult
+    
+    model = create_model(
+        "MetricsResult",
+        __base__=MetricGroupResult,
+        **{name: (MetricResult, Field(..., description=f"{name.replace('_', ' ').title()} result")) for name in metric_names}
+    )
+    if msgspec is not None:
+        _STRUCTS[model] = msgspec.defstruct("MetricsResultStruct", [(name, MetricResultStruct) for name in metric_names])
+    return model
+
+
+# Semantic cache namespace of the batched metric results
+METRICS_CACHE_NAMESPACE = "all_metrics_batched"
+
+
+# Model each analysis response must match, keyed by analysis name
+RESPONSE_MODELS: Dict[str, Type[BaseModel]] = {
+    "topic_analysis": TopicAnalysis,
+    "sentiment_analysis": SentimentAnalysis,
+    "advocacy_analysis": AdvocacyAnalysis,
+    "geographic_spread": GeographicSpread,
+    "demographic_spread": DemographicSpread,
+    "intent_analysis": IntentAnalysis,
+}
+
+# Format instructions of each analysis, keyed by analysis name
+FORMAT_INSTRUCTIONS: Dict[str, str] = {name: format_instructions(model) for name, model in RESPONSE_MODELS.items()}
+
+
+# OpenAI client of each event loop, shared by all generators. httpx binds
+# connections to the loop that opened them, so a client can't be shared
+# across loops.
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, openai.AsyncOpenAI]" = weakref.WeakKeyDictionary()
+
+
+def openai_client() -> openai.AsyncOpenAI:
+    """
+    Get the OpenAI client of the running event loop.
+    
+    The client keeps a pool of HTTP/2 connections, so concurrent requests
+    multiplex over one TLS connection instead of each opening their own,
+    even across generator instances.
+    """
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None:
+        http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_KEEPALIVE),
+            timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+        )
+        client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
+        _CLIENTS[loop] = client
+    return client
+
+
+class ChatRequest(NamedTuple):
+    """Static part of the chat completion request of an analysis."""
+    model: str
+    system_prompt: str
+
+
+def cache_key_text(text: Optional[str]) -> str:
+    """Normalize a brand name, industry or context for use in a cache key."""
+    return (text or "").strip().lower()
+
+
+class SemanticCache:
+    """
+    In-memory cache of LLM results that tolerates rephrased context.
+    
+    Entries are bucketed by (namespace, brand, industry), which must match
+    after normalization with cache_key_text, as contexts are. Within a
+    bucket, an identical context is a hit without further work; otherwise
+    the context is embedded and compared with the contexts in the bucket,
+    and the closest one is a hit if its cosine similarity reaches the
+    threshold. Embeddings are only computed when a bucket has entries to
+    compare against.
+    """
+    
+    def __init__(
+        self,
+        embed: Callable[[List[str]], Awaitable[List[List[float]]]],
+        threshold: float = 0.95,
+        max_buckets: int = 1024,
+        max_bucket_size: int = 16
+    ):
         """
-        Initialize the LLM metric generator.
+        Initialize the semantic cache.
         
         Args:
-            model_name: Name of the LLM model to use
-            temperature: Temperature parameter for the LLM
+            embed: Coroutine function embedding a list of texts
+            threshold: Minimum cosine similarity for contexts to match
+            max_buckets: Maximum number of (namespace, brand, industry) buckets kept
+            max_bucket_size: Maximum number of contexts kept per bucket
         """
-        self.llm = ChatOpenAI(
-            model_name=model_name,
-            temperature=temperature,
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+        self.embed = embed
+        self.threshold = threshold
+        self.max_buckets = max_buckets
+        self.max_bucket_size = max_bucket_size
+        
+        # Bucket key -> context -> result, least recently used bucket first
+        self._buckets: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
         
-        # Initialize output parsers
-        self.metric_parser = PydanticOutputParser(pydantic_object=MetricResult)
-        self.topic_parser = PydanticOutputParser(pydantic_object=TopicAnalysis)
-        self.sentiment_parser = PydanticOutputParser(pydantic_object=SentimentAnalysis)
-        self.advocacy_parser = PydanticOutputParser(pydantic_object=AdvocacyAnalysis)
-        self.geographic_parser = PydanticOutputParser(pydantic_object=GeographicSpread)
-        self.demographic_parser = PydanticOutputParser(pydantic_object=DemographicSpread)
-        self.intent_parser = PydanticOutputParser(pydantic_object=IntentAnalysis)
+        # Context -> unit-length embedding, for contexts stored in any bucket
+        self._embeddings: Dict[str, np.ndarray] = {}
     
-    def generate_all_metrics(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, float]:
+    @staticmethod
+    def _bucket_key(namespace: str, brand_name: str, industry: str) -> Tuple[str, str, str]:
+        return (namespace, cache_key_text(brand_name), cache_key_text(industry))
+    
+    async def _embed_missing(self, contexts: List[str]):
+        """Embed and store the contexts that have no embedding yet."""
+        missing = [context for context in contexts if context not in self._embeddings]
+        if not missing:
+            return
+        
+        vectors = np.asarray(await self.embed(missing), dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        self._embeddings.update(zip(missing, vectors))
+    
+    async def get(self, namespace: str, brand_name: str, industry: str, context: str) -> Optional[Any]:
         """
-        Generate all five resonance metrics for a given brand.
+        Look up a cached result.
         
         Args:
+            namespace: Name of the analysis the result belongs to
             brand_name: Name of the brand
             industry: Industry of the brand
-            additional_context: Additional context about the brand
+            context: Additional context the result was generated with
             
         Returns:
-            Dict[str, float]: Dictionary with scores for all five metrics
+            The cached result, or None on a miss
         """
-        metrics = {}
-        
-        # Generate each metric
-        metrics["conversational_depth"] = self.generate_conversational_depth(brand_name, industry, additional_context)["score"]
-        metrics["community_spread"] = self.generate_community_spread(brand_name, industry, additional_context)["score"]
-        metrics["emotional_intensity"] = self.generate_emotional_intensity(brand_name, industry, additional_context)["score"]
-        metrics["intent_signals"] = self.generate_intent_signals(brand_name, industry, additional_context)["score"]
-        metrics["advocacy_language"] = self.generate_advocacy_language(brand_name, industry, additional_context)["score"]
-        
-        return metrics
+        key = self._bucket_key(namespace, brand_name, industry)
+        context = cache_key_text(context)
+        bucket = self._buckets.get(key)
+        if not bucket:
+            return None
+        self._buckets.move_to_end(key)
+        
+        if context in bucket:
+            return bucket[context]
+        
+        # An empty context only matches exactly, and can't be embedded
+        candidates = [c for c in bucket if c]
+        if not context or not candidates:
+            return None
+        
+        try:
+            await self._embed_missing(candidates + [context])
+        except Exception as e:
+            print(f"Error embedding context for semantic cache: {e}")
+            return None
+        
+        similarities = np.stack([self._embeddings[c] for c in candidates]) @ self._embeddings[context]
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return bucket[candidates[best]]
+        return None
     
-    def generate_conversational_depth(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+    def set(self, namespace: str, brand_name: str, industry: str, context: str, result: Any):
         """
-        Generate the Conversational Depth metric for a brand.
+        Store a result, evicting the oldest context and least recently used bucket when full.
         
         Args:
+            namespace: Name of the analysis the result belongs to
             brand_name: Name of the brand
             industry: Industry of the brand
-            additional_context: Additional context about the brand
-            
-        Returns:
-            Dict: Dictionary with score, reasoning, and key insights
+            context: Additional context the result was generated with
+            result: Result to cache
         """
-        template = """
-        You are an expert brand analyst with deep knowledge of consumer behavior and brand conversations.
-        
-        Analyze the conversational depth for the brand {brand_name} in the {industry} industry.
-        
-        Additional context: {additional_context}
-        
-        Conversational Depth measures how substantive and meaningful conversations about a brand are.
-        High conversational depth indicates that people engage in detailed, thoughtful discussions about the brand,
-        while low depth suggests superficial mentions without meaningful engagement.
-        
-        Consider factors like:
-        - Length and detail of typical brand mentions
-        - Complexity and sophistication of discussions
-        - Presence of specific product/service details in conversations
-        - Whether conversations go beyond surface-level comments
-        - Depth of knowledge demonstrated in brand discussions
-        
-        Based on your expert knowledge and the information provided, generate:
-        1. A score from 0-100 for Conversational Depth
-        2. Reasoning for this score
-        3. Key insights that contributed to this score
-        
-        {format_instructions}
+        key = self._bucket_key(namespace, brand_name, industry)
+        context = cache_key_text(context)
+        bucket = self._buckets.setdefault(key, {})
+        self._buckets.move_to_end(key)
+        bucket[context] = result
+        
+        while len(bucket) > self.max_bucket_size:
+            del bucket[next(iter(bucket))]
+        while len(self._buckets) > self.max_buckets:
+            self._buckets.popitem(last=False)
+        
+        # Drop embeddings no bucket refers to any more
+        if len(self._embeddings) > self.max_buckets * self.max_bucket_size:
+            live = {c for b in self._buckets.values() for c in b}
+            self._embeddings = {c: v for c, v in self._embeddings.items() if c in live}
+
+
+class LLMMetricGenerator:
+    """
+    Generates brand resonance metrics using large language models.
+    """
+    
+    def __init__(
+        self,
+        model_name: str = "gpt-4o-mini",
+        temperature: float = 0.2,
+        model_routing: Optional[Dict[str, str]] = None,
+        embedding_model: str = "text-embedding-3-small",
+        semantic_cache_threshold: Optional[float] = 0.95,
+        disk_cache_dir: Optional[str] = ".llm_cache"
+    ):
         """
+        Initialize the LLM metric generator.
         
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["brand_name", "industry", "additional_context"],
-            partial_variables={"format_instructions": self.metric_parser.get_format_instructions()}
-        )
-        
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        result = chain.run(brand_name=brand_name, industry=industry, additional_context=additional_context or "No additional context provided.")
-        
-        # Parse the result
-        parsed_result = self.metric_parser.parse(result)
-        return parsed_result.dict()
+        Args:
+            model_name: Name of the LLM model used for metrics and analyses missing
+                from model_routing; it must support JSON mode
+            temperature: Temperature parameter for the LLM
+            model_routing: Model name for each metric and analysis name, defaulting
+                to DEFAULT_MODEL_ROUTING
+            embedding_model: Name of the model embedding contexts for the semantic cache
+            semantic_cache_threshold: Cosine similarity at which two contexts for the
+                same brand and industry share results, or None to disable the cache
+            disk_cache_dir: Directory of the persistent cache of exact-match results,
+                or None to disable it; it is also disabled without diskcache installed
+        """
+        self.model_name = model_name
+        self.temperature = temperature
+        self.embedding_model = embedding_model
+        self.model_routing = dict(DEFAULT_MODEL_ROUTING if model_routing is None else model_routing)
+        
+        self.semantic_cache = None
+        if semantic_cache_threshold is not None:
+            self.semantic_cache = SemanticCache(self._embed, threshold=semantic_cache_threshold)
+        
+        # Requests and response decoders are static, so build them once
+        self._requests = {
+            name: self._chat_request(self.model_routing.get(name, model_name), SYSTEM_PROMPTS[name], FORMAT_INSTRUCTIONS[name])
+            for name in RESPONSE_MODELS
+        }
+        self._decoders = {name: json_decoder(model) for name, model in RESPONSE_MODELS.items()}
+        
+        self.disk_cache = None
+        if disk_cache_dir is not None and diskcache is not None:
+            self.disk_cache = diskcache.Cache(disk_cache_dir, size_limit=DISK_CACHE_SIZE_LIMIT)
+        
+        # Metrics routed to the same model are scored together in one call
+        metric_groups: Dict[str, List[str]] = {}
+        for metric_name in METRIC_NAMES:
+            metric_groups.setdefault(self.model_routing.get(metric_name, model_name), []).append(metric_name)
+        
+        # Metric group key -> names of the metrics in the group
+        self._metric_groups: Dict[str, Tuple[str, ...]] = {}
+        for group_model, metric_names in metric_groups.items():
+            key = f"metrics:{group_model}"
+            response_model = metrics_response_model(tuple(metric_names))
+            self._requests[key] = self._chat_request(
+                group_model,
+                metrics_system_prompt(metric_names),
+                format_instructions(response_model)
+            )
+            self._decoders[key] = json_decoder(response_model)
+            self._metric_groups[key] = tuple(metric_names)
+        
+        # Disk cache keys cover the models and prompts behind a result, so
+        # results are not reused after either changes
+        self._cache_salts = {name: self._cache_salt([name]) for name in RESPONSE_MODELS}
+        self._cache_salts[METRICS_CACHE_NAMESPACE] = self._cache_salt(self._metric_groups)
+        
+        # Semaphores are bound to an event loop, so keep one per loop
+        self._semaphores = weakref.WeakKeyDictionary()
+        
+        # Private event loop the synchronous wrappers run coroutines on
+        self._loop = None
     
-    def generate_community_spread(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _chat_request(model: str, system_prompt: str, format_instructions: str) -> ChatRequest:
         """
-        Generate the Community Spread metric for a brand.
+        Build the static part of a request whose per-request details come last.
+        
+        The system message holds the shared guidelines, task description and
+        format instructions, and is identical on every call so OpenAI's
+        prompt caching can reuse it. Only the user message varies.
         
         Args:
-            brand_name: Name of the brand
-            industry: Industry of the brand
-            additional_context: Additional context about the brand
+            model: Name of the model answering the request
+            system_prompt: Static description of the analysis task
+            format_instructions: Output format instructions for the analysis
             
         Returns:
-            Dict: Dictionary with score, reasoning, and key insights
-        """
-        template = """
-        You are an expert brand analyst with deep knowledge of consumer behavior and brand communities.
-        
-        Analyze the community spread for the brand {brand_name} in the {industry} industry.
-        
-        Additional context: {additional_context}
-        
-        Community Spread measures how widely a brand is discussed across different communities, platforms, and demographic groups.
-        High community spread indicates that the brand has penetrated diverse communities and audiences,
-        while low spread suggests the brand is only discussed within limited or niche groups.
-        
-        Consider factors like:
-        - Diversity of platforms where the brand is discussed
-        - Variety of demographic groups engaging with the brand
-        - Geographic spread of brand conversations
-        - Presence across different interest communities
-        - Cross-cultural relevance
-        
-        Based on your expert knowledge and the information provided, generate:
-        1. A score from 0-100 for Community Spread
-        2. Reasoning for this score
-        3. Key insights that contributed to this score
-        
-        {format_instructions}
+            ChatRequest: Model and complete system message of the request
         """
-        
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["brand_name", "industry", "additional_context"],
-            partial_variables={"format_instructions": self.metric_parser.get_format_instructions()}
-        )
-        
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        result = chain.run(brand_name=brand_name, industry=industry, additional_context=additional_context or "No additional context provided.")
-        
-        # Parse the result
-        parsed_result = self.metric_parser.parse(result)
-        return parsed_result.dict()
+        return ChatRequest(model, sys.intern("\n".join((ANALYST_GUIDELINES, system_prompt, format_instructions))))
     
-    def generate_emotional_intensity(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+    def _request_body(self, name: str, brand_name: str, industry: str, additional_context: Optional[str]) -> Dict[str, Any]:
         """
-        Generate the Emotional Intensity metric for a brand.
+        Build the chat completion request body of an analysis for a brand.
         
         Args:
+            name: Name of the analysis, or the key of a metric group
             brand_name: Name of the brand
             industry: Industry of the brand
             additional_context: Additional context about the brand
             
         Returns:
-            Dict: Dictionary with score, reasoning, and key insights
+            Dict: Chat completion parameters
         """
-        template = """
-        You are an expert brand analyst with deep knowledge of consumer psychology and emotional connections to brands.
-        
-        Analyze the emotional intensity for the brand {brand_name} in the {industry} industry.
-        
-        Additional context: {additional_context}
-        
-        Emotional Intensity measures the strength of emotional reactions and connections people have with a brand.
-        High emotional intensity indicates strong emotional responses (positive or negative),
-        while low intensity suggests emotional indifference or weak connections.
-        
-        Consider factors like:
-        - Use of emotional language in brand discussions
-        - Presence of strong sentiment (positive or negative)
-        - Personal stories or experiences shared about the brand
-        - Expressions of brand loyalty or attachment
-        - Emotional responses to brand actions or communications
-        
-        Based on your expert knowledge and the information provided, generate:
-        1. A score from 0-100 for Emotional Intensity
-        2. Reasoning for this score
-        3. Key insights that contributed to this score
-        
-        {format_instructions}
-        """
-        
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["brand_name", "industry", "additional_context"],
-            partial_variables={"format_instructions": self.metric_parser.get_format_instructions()}
+        request = self._requests[name]
+        user_message = HUMAN_TEMPLATE.format(
+            brand_name=brand_name,
+            industry=industry,
+            additional_context=additional_context or "No additional context provided."
         )
-        
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        result = chain.run(brand_name=brand_name, industry=industry, additional_context=additional_context or "No additional context provided.")
-        
-        # Parse the result
-        parsed_result = self.metric_parser.parse(result)
-        return parsed_result.dict()
+        return {
+            "model": request.model,
+            "temperature": self.temperature,
+            # JSON mode guarantees the response is a single JSON object
+            "response_format": {"type": "json_object"},
+            "messages": [
+                {"role": "system", "content": request.system_prompt},
+                {"role": "user", "content": user_message},
+            ]
+        }
     
-    def generate_intent_signals(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+    async def _embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts for the semantic cache."""
+        response = await openai_client().embeddings.create(model=self.embedding_model, input=texts)
+        return [item.embedding for item in response.data]
+    
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent requests on the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            self._semaphores[loop] = semaphore
+        return semaphore
+    
+    async def _arun(
+        self,
+        body: Dict[str, Any],
+        on_chunk: Optional[Callable[[bytearray, bytes], None]] = None
+    ) -> bytes:
         """
-        Generate the Intent Signals metric for a brand.
+        Stream a chat completion, retrying with exponential backoff when rate limited.
         
         Args:
-            brand_name: Name of the brand
-            industry: Industry of the brand
-            additional_context: Additional context about the brand
+            body: Chat completion parameters
+            on_chunk: Function called with the output received so far and the
+                latest chunk, each time a chunk arrives
             
         Returns:
-            Dict: Dictionary with score, reasoning, and key insights
-        """
-        template = """
-        You are an expert brand analyst with deep knowledge of consumer purchase behavior and intent signals.
-        
-        Analyze the intent signals for the brand {brand_name} in the {industry} industry.
-        
-        Additional context: {additional_context}
-        
-        Intent Signals measures indications of purchase intent or consideration in brand conversations.
-        High intent signals indicate strong purchase consideration and active buying signals,
-        while low signals suggest minimal purchase interest or consideration.
-        
-        Consider factors like:
-        - Expressions of desire to purchase or try products/services
-        - Questions about pricing, availability, or features
-        - Comparisons with competitor products/services
-        - Discussions about purchase experiences
-        - Pre-purchase research conversations
-        - Post-purchase intent to repurchase
-        
-        Based on your expert knowledge and the information provided, generate:
-        1. A score from 0-100 for Intent Signals
-        2. Reasoning for this score
-        3. Key insights that contributed to this score
-        
-        {format_instructions}
+            bytes: Raw LLM output
         """
-        
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["brand_name", "industry", "additional_context"],
-            partial_variables={"format_instructions": self.metric_parser.get_format_instructions()}
-        )
-        
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        result = chain.run(brand_name=brand_name, industry=industry, additional_context=additional_context or "No additional context provided.")
-        
-        # Parse the result
-        parsed_result = self.metric_parser.parse(result)
-        return parsed_result.dict()
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                async with self._semaphore():
+                    stream = await openai_client().chat.completions.create(**body, stream=True)
+                    buffer = bytearray()
+                    async for chunk in stream:
+                        if not chunk.choices or not chunk.choices[0].delta.content:
+                            continue
+                        data = chunk.choices[0].delta.content.encode()
+                        buffer += data
+                        if on_chunk is not None:
+                            on_chunk(buffer, data)
+                return bytes(buffer)
+            except openai.RateLimitError:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+            # Back off outside the semaphore so other requests can proceed
+            await asyncio.sleep(RETRY_BASE_DELAY * 2 ** attempt * (1 + random.random()))
     
-    def generate_advocacy_language(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+    async def _run_analysis(self, name: str, brand_name: str, industry: str, additional_context: Optional[str]) -> Dict[str, Any]:
         """
-        Generate the Advocacy Language metric for a brand.
+        Run an analysis and decode its response.
         
         Args:
+            name: Name of the analysis, or the key of a metric group
             brand_name: Name of the brand
             industry: Industry of the brand
             additional_context: Additional context about the brand
             
         Returns:
-            Dict: Dictionary with score, reasoning, and key insights
+            Dict: Decoded and validated response
         """
-        template = """
-        You are an expert brand analyst with deep knowledge of brand advocacy and consumer recommendations.
-        
-        Analyze the advocacy language for the brand {brand_name} in the {industry} industry.
-        
-        Additional context: {additional_context}
-        
-        Advocacy Language measures how strongly people recommend or advocate for a brand to others.
-        High advocacy language indicates strong recommendations and brand championing,
-        while low advocacy suggests minimal or negative recommendations.
-        
-        Consider factors like:
-        - Explicit recommendations to others
-        - Defending the brand against criticism
-        - Sharing positive experiences unprompted
-        - Word-of-mouth promotion language
-        - Expressions of brand loyalty and commitment
-        - Willingness to be associated with the brand
-        
-        Based on your expert knowledge and the information provided, generate:
-        1. A score from 0-100 for Advocacy Language
-        2. Reasoning for this score
-        3. Key insights that contributed to this score
-        
-        {format_instructions}
-        """
-        
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["brand_name", "industry", "additional_context"],
-            partial_variables={"format_instructions": self.metric_parser.get_format_instructions()}
-        )
-        
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        result = chain.run(brand_name=brand_name, industry=industry, additional_context=additional_context or "No additional context provided.")
-        
-        # Parse the result
-        parsed_result = self.metric_parser.parse(result)
-        return parsed_result.dict()
+        result = await self._arun(self._request_body(name, brand_name, industry, additional_context))
+        return self._decoders[name](result)
     
-    def generate_topic_analysis(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+    def _cache_salt(self, names: Iterable[str]) -> str:
+        """Digest the models and system prompts of the given requests."""
+        digest = hashlib.blake2b(digest_size=16)
+        for name in names:
+            request = self._requests[name]
+            digest.update(f"{request.model}|{request.system_prompt}|".encode())
+        return digest.hexdigest()
+    
+    def _disk_cache_key(self, namespace: str, brand_name: str, industry: str, context: str) -> str:
+        """Build the disk cache key of a result, normalizing its fields like the semantic cache."""
+        key = "|".join((
+            self._cache_salts[namespace],
+            namespace,
+            cache_key_text(brand_name),
+            cache_key_text(industry),
+            cache_key_text(context)
+        ))
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    
+    async def _disk_cache_get(self, namespace: str, brand_name: str, industry: str, context: str) -> Optional[Any]:
+        """Get a result from the disk cache, or None if it is missing or disabled."""
+        if self.disk_cache is None:
+            return None
+        # diskcache is backed by SQLite, so keep its I/O off the event loop
+        raw = await asyncio.to_thread(self.disk_cache.get, self._disk_cache_key(namespace, brand_name, industry, context))
+        return None if raw is None else orjson.loads(raw)
+    
+    async def _disk_cache_set(self, namespace: str, brand_name: str, industry: str, context: str, result: Any):
+        """Store a result in the disk cache, if it is enabled."""
+        if self.disk_cache is None:
+            return
+        key = self._disk_cache_key(namespace, brand_name, industry, context)
+        await asyncio.to_thread(self.disk_cache.set, key, orjson.dumps(result), expire=DISK_CACHE_EXPIRE)
+    
+    async def _cached(
+        self,
+        namespace: str,
+        brand_name: str,
+        industry: str,
+        additional_context: Optional[str],
+        compute: Callable[[], Awaitable[T]]
+    ) -> T:
         """
-        Generate topic analysis for brand conversations.
+        Serve a result from the caches, computing and storing it on a miss.
+        
+        The disk cache (exact matches, persistent across restarts and shared
+        between processes) is checked first, then the in-memory semantic cache.
         
         Args:
+            namespace: Name under which the results are cached
             brand_name: Name of the brand
             industry: Industry of the brand
             additional_context: Additional context about the brand
+            compute: Coroutine function producing the result on a cache miss
             
         Returns:
-            Dict: Dictionary with topic analysis results
+            The cached or computed result
         """
-        template = """
-        You are an expert brand analyst specializing in conversation analysis and topic modeling.
-        
-        Analyze the likely conversation topics for the brand {brand_name} in the {industry} industry.
-        
-        Additional context: {additional_context}
-        
-        Generate a realistic topic analysis that identifies the main topics discussed in relation to this brand.
-        For each topic, provide:
-        - Topic name
-        - Prevalence (percentage of conversations)
-        - Key terms associated with this topic
-        - Sample phrases that would appear in this topic
-        
-        The topics should be realistic and specific to the brand and industry.
-        
-        {format_instructions}
+        context = additional_context or ""
+        result = await self._disk_cache_get(namespace, brand_name, industry, context)
+        if result is not None:
+            return result
+        
+        cache = self.semantic_cache
+        if cache is not None:
+            cached = await cache.get(namespace, brand_name, industry, context)
+            if cached is not None:
+                # Hand out copies so callers can't modify the cached result
+                result = copy.deepcopy(cached)
+        
+        if result is None:
+            result = await compute()
+            if cache is not None:
+                cache.set(namespace, brand_name, industry, context, copy.deepcopy(result))
+        
+        await self._disk_cache_set(namespace, brand_name, industry, context, result)
+        return result
+    
+    def _run_sync(self, coro: Awaitable[T]) -> T:
         """
+        Run a coroutine to completion for a synchronous caller.
         
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["brand_name", "industry", "additional_context"],
-            partial_variables={"format_instructions": self.topic_parser.get_format_instructions()}
-        )
-        
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        result = chain.run(brand_name=brand_name, industry=industry, additional_context=additional_context or "No additional context provided.")
-        
-        # Parse the result
-        parsed_result = self.topic_parser.parse(result)
-        return parsed_result.dict()
+        A private event loop is reused across calls rather than a fresh one
+        per asyncio.run(), since the async OpenAI client keeps connections
+        bound to the loop that opened them. Must not be called from a running
+        event loop; await the async variant there instead.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
     
-    def generate_sentiment_analysis(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+    async def agenerate_all_metrics(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, float]:
         """
-        Generate sentiment analysis for brand conversations.
+        Generate all five resonance metrics for a given brand.
         
         Args:
             brand_name: Name of the brand
@@ -420,44 +951,16 @@ class LLMMetricGenerator:
             additional_context: Additional context about the brand
             
         Returns:
-            Dict: Dictionary with sentiment analysis results
-        """
-        template = """
-        You are an expert brand analyst specializing in sentiment analysis and emotional response.
-        
-        Analyze the likely sentiment distribution for the brand {brand_name} in the {industry} industry.
-        
-        Additional context: {additional_context}
-        
-        Generate a realistic sentiment distribution that shows how sentiment is distributed in conversations about this brand.
-        Provide the percentage breakdown across these sentiment categories:
-        - Very Positive
-        - Positive
-        - Neutral
-        - Negative
-        - Very Negative
-        
-        The distribution should be realistic and specific to the brand and industry.
-        
-        {format_instructions}
+            Dict[str, float]: Dictionary with scores for all five metrics
         """
-        
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["brand_name", "industry", "additional_context"],
-            partial_variables={"format_instructions": self.sentiment_parser.get_format_instructions()}
-        )
-        
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        result = chain.run(brand_name=brand_name, industry=industry, additional_context=additional_context or "No additional context provided.")
-        
-        # Parse the result
-        parsed_result = self.sentiment_parser.parse(result)
-        return parsed_result.dict()
+        metrics = await self.agenerate_all_metrics_batched(brand_name, industry, additional_context)
+        return {metric_name: result["score"] for metric_name, result in metrics.items()}
     
-    def generate_advocacy_analysis(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+    async def agenerate_all_metrics_batched(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
-        Generate advocacy analysis for a brand.
+        Generate the detailed results of all five resonance metrics in batched LLM calls.
+        
+        Metrics routed to the same model are scored together in a single call.
         
         Args:
             brand_name: Name of the brand
@@ -465,160 +968,316 @@ class LLMMetricGenerator:
             additional_context: Additional context about the brand
             
         Returns:
-            Dict: Dictionary with advocacy analysis results
-        """
-        template = """
-        You are an expert brand analyst specializing in brand advocacy and consumer recommendations.
-        
-        Analyze the likely advocacy patterns for the brand {brand_name} in the {industry} industry.
-        
-        Additional context: {additional_context}
-        
-        Generate a realistic advocacy analysis that shows:
-        - Overall advocacy strength (0-100)
-        - Percentage of brand advocates among those discussing the brand
-        - Key phrases commonly used by brand advocates
-        
-        The analysis should be realistic and specific to the brand and industry.
-        
-        {format_instructions}
+            Dict[str, Dict]: Score, reasoning, and key insights keyed by metric name
         """
+        async def compute() -> Dict[str, Dict[str, Any]]:
+            # One call per group of metrics routed to the same model, run concurrently
+            groups = await asyncio.gather(*[
+                self._run_analysis(key, brand_name, industry, additional_context) for key in self._metric_groups
+            ])
+            
+            merged = {}
+            for group in groups:
+                merged.update(group)
+            return {metric_name: merged[metric_name] for metric_name in METRIC_NAMES}
         
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["brand_name", "industry", "additional_context"],
-            partial_variables={"format_instructions": self.advocacy_parser.get_format_instructions()}
-        )
-        
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        result = chain.run(brand_name=brand_name, industry=industry, additional_context=additional_context or "No additional context provided.")
-        
-        # Parse the result
-        parsed_result = self.advocacy_parser.parse(result)
-        return parsed_result.dict()
+        return await self._cached(METRICS_CACHE_NAMESPACE, brand_name, industry, additional_context, compute)
     
-    def generate_geographic_spread(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+    async def astream_all_metrics(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
         """
-        Generate geographic spread analysis for a brand.
+        Generate the detailed results of all five resonance metrics, yielding each one as soon as it is complete.
+        
+        The batched responses are parsed incrementally while they stream in,
+        so early metrics reach the caller before the later ones have been
+        generated. Results are shared with agenerate_all_metrics_batched
+        through the disk and semantic caches.
         
         Args:
             brand_name: Name of the brand
             industry: Industry of the brand
             additional_context: Additional context about the brand
             
-        Returns:
-            Dict: Dictionary with geographic spread results
-        """
-        template = """
-        You are an expert brand analyst specializing in global brand presence and regional analysis.
-        
-        Analyze the likely geographic spread for the brand {brand_name} in the {industry} industry.
-        
-        Additional context: {additional_context}
-        
-        Generate a realistic geographic distribution that shows how brand conversations are distributed across different regions.
-        Provide the percentage breakdown across major regions (e.g., North America, Europe, Asia, etc.).
-        
-        The distribution should be realistic and specific to the brand and industry.
-        
-        {format_instructions}
+        Yields:
+            Tuple[str, Dict]: Metric name and its score, reasoning, and key insights,
+            in the order the metrics complete
         """
-        
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["brand_name", "industry", "additional_context"],
-            partial_variables={"format_instructions": self.geographic_parser.get_format_instructions()}
-        )
-        
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        result = chain.run(brand_name=brand_name, industry=industry, additional_context=additional_context or "No additional context provided.")
-        
-        # Parse the result
-        parsed_result = self.geographic_parser.parse(result)
-        return parsed_result.dict()
+        cache = self.semantic_cache
+        context = additional_context or ""
+        cached = await self._disk_cache_get(METRICS_CACHE_NAMESPACE, brand_name, industry, context)
+        if cached is None and cache is not None:
+            cached = await cache.get(METRICS_CACHE_NAMESPACE, brand_name, industry, context)
+            if cached is not None:
+                cached = copy.deepcopy(cached)
+                await self._disk_cache_set(METRICS_CACHE_NAMESPACE, brand_name, industry, context, cached)
+        if cached is not None:
+            for item in cached.items():
+                yield item
+            return
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        body_args = (brand_name, industry, additional_context)
+        
+        async def run_group(key: str) -> Dict[str, Dict[str, Any]]:
+            metric_names = self._metric_groups[key]
+            emitted = set()
+            
+            def emit(metric_name: str, result: Dict[str, Any]):
+                if metric_name in metric_names and metric_name not in emitted:
+                    emitted.add(metric_name)
+                    queue.put_nowait((metric_name, result))
+            
+            def on_chunk(buffer: bytearray, data: bytes):
+                # A metric can only have completed when an object closed
+                if b"}" not in data:
+                    return
+                partial = jiter.from_json(bytes(buffer), partial_mode=True)
+                # Every entry but the last is complete since a later one has started
+                for metric_name in list(partial)[:-1]:
+                    if metric_name in metric_names and metric_name not in emitted:
+                        # Validate like the final decode, so nothing invalid is yielded
+                        emit(metric_name, validate_metric_result(partial[metric_name]))
+            
+            try:
+                raw = await self._arun(self._request_body(key, *body_args), on_chunk)
+                results = self._decoders[key](raw)
+                for metric_name in metric_names:
+                    emit(metric_name, results[metric_name])
+                return results
+            finally:
+                queue.put_nowait(None)
+        
+        tasks = [asyncio.ensure_future(run_group(key)) for key in self._metric_groups]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                else:
+                    yield item
+            groups = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        merged = {}
+        for group in groups:
+            merged.update(group)
+        results = {metric_name: merged[metric_name] for metric_name in METRIC_NAMES}
+        if cache is not None:
+            cache.set(METRICS_CACHE_NAMESPACE, brand_name, industry, context, copy.deepcopy(results))
+        await self._disk_cache_set(METRICS_CACHE_NAMESPACE, brand_name, industry, context, results)
     
-    def generate_demographic_spread(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+    async def agenerate(self, name: str, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
         """
-        Generate demographic spread analysis for a brand.
+        Generate a single metric or analysis for a brand.
+        
+        Metrics index into agenerate_all_metrics_batched, so call that once
+        instead when more than one metric is needed. Analyses are served from
+        the semantic cache when possible.
         
         Args:
+            name: Name of the metric (a key of METRIC_DEFINITIONS) or analysis
+                (a key of RESPONSE_MODELS)
             brand_name: Name of the brand
             industry: Industry of the brand
             additional_context: Additional context about the brand
             
         Returns:
-            Dict: Dictionary with demographic spread results
+            Dict: Score, reasoning, and key insights for a metric, or the analysis results
         """
-        template = """
-        You are an expert brand analyst specializing in consumer demographics and audience segmentation.
-        
-        Analyze the likely demographic spread for the brand {brand_name} in the {industry} industry.
-        
-        Additional context: {additional_context}
-        
-        Generate a realistic demographic distribution that shows how brand conversations are distributed across:
-        - Age groups (e.g., 18-24, 25-34, 35-44, etc.)
-        - Gender
-        - Income levels
-        
-        The distribution should be realistic and specific to the brand and industry.
-        
-        {format_instructions}
-        """
-        
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["brand_name", "industry", "additional_context"],
-            partial_variables={"format_instructions": self.demographic_parser.get_format_instructions()}
+        if name in METRIC_DEFINITIONS:
+            metrics = await self.agenerate_all_metrics_batched(brand_name, industry, additional_context)
+            return metrics[name]
+        if name not in RESPONSE_MODELS:
+            raise ValueError(f"Unknown metric or analysis: {name}")
+        
+        return await self._cached(
+            name, brand_name, industry, additional_context,
+            lambda: self._run_analysis(name, brand_name, industry, additional_context)
         )
-        
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        result = chain.run(brand_name=brand_name, industry=industry, additional_context=additional_context or "No additional context provided.")
-        
-        # Parse the result
-        parsed_result = self.demographic_parser.parse(result)
-        return parsed_result.dict()
+    
+    async def agenerate_conversational_depth(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Generate the Conversational Depth metric for a brand."""
+        return await self.agenerate("conversational_depth", brand_name, industry, additional_context)
+    
+    async def agenerate_community_spread(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Generate the Community Spread metric for a brand."""
+        return await self.agenerate("community_spread", brand_name, industry, additional_context)
+    
+    async def agenerate_emotional_intensity(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Generate the Emotional Intensity metric for a brand."""
+        return await self.agenerate("emotional_intensity", brand_name, industry, additional_context)
+    
+    async def agenerate_intent_signals(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Generate the Intent Signals metric for a brand."""
+        return await self.agenerate("intent_signals", brand_name, industry, additional_context)
+    
+    async def agenerate_advocacy_language(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Generate the Advocacy Language metric for a brand."""
+        return await self.agenerate("advocacy_language", brand_name, industry, additional_context)
+    
+    async def agenerate_topic_analysis(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Generate topic analysis for a brand."""
+        return await self.agenerate("topic_analysis", brand_name, industry, additional_context)
+    
+    async def agenerate_sentiment_analysis(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Generate sentiment analysis for a brand."""
+        return await self.agenerate("sentiment_analysis", brand_name, industry, additional_context)
+    
+    async def agenerate_advocacy_analysis(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Generate advocacy analysis for a brand."""
+        return await self.agenerate("advocacy_analysis", brand_name, industry, additional_context)
+    
+    async def agenerate_geographic_spread(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Generate geographic spread analysis for a brand."""
+        return await self.agenerate("geographic_spread", brand_name, industry, additional_context)
+    
+    async def agenerate_demographic_spread(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Generate demographic spread analysis for a brand."""
+        return await self.agenerate("demographic_spread", brand_name, industry, additional_context)
+    
+    async def agenerate_intent_analysis(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Generate intent signal analysis for a brand."""
+        return await self.agenerate("intent_analysis", brand_name, industry, additional_context)
+    
+    # Synchronous wrappers for callers outside an event loop
+    
+    def generate(self, name: str, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate."""
+        return self._run_sync(self.agenerate(name, brand_name, industry, additional_context))
+    
+    def generate_all_metrics(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, float]:
+        """Synchronous version of agenerate_all_metrics."""
+        return self._run_sync(self.agenerate_all_metrics(brand_name, industry, additional_context))
+    
+    def generate_all_metrics_batched(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Synchronous version of agenerate_all_metrics_batched."""
+        return self._run_sync(self.agenerate_all_metrics_batched(brand_name, industry, additional_context))
+    
+    def generate_conversational_depth(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate_conversational_depth."""
+        return self.generate("conversational_depth", brand_name, industry, additional_context)
+    
+    def generate_community_spread(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate_community_spread."""
+        return self.generate("community_spread", brand_name, industry, additional_context)
+    
+    def generate_emotional_intensity(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate_emotional_intensity."""
+        return self.generate("emotional_intensity", brand_name, industry, additional_context)
+    
+    def generate_intent_signals(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate_intent_signals."""
+        return self.generate("intent_signals", brand_name, industry, additional_context)
+    
+    def generate_advocacy_language(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate_advocacy_language."""
+        return self.generate("advocacy_language", brand_name, industry, additional_context)
+    
+    def generate_topic_analysis(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate_topic_analysis."""
+        return self.generate("topic_analysis", brand_name, industry, additional_context)
+    
+    def generate_sentiment_analysis(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate_sentiment_analysis."""
+        return self.generate("sentiment_analysis", brand_name, industry, additional_context)
+    
+    def generate_advocacy_analysis(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate_advocacy_analysis."""
+        return self.generate("advocacy_analysis", brand_name, industry, additional_context)
+    
+    def generate_geographic_spread(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate_geographic_spread."""
+        return self.generate("geographic_spread", brand_name, industry, additional_context)
+    
+    def generate_demographic_spread(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate_demographic_spread."""
+        return self.generate("demographic_spread", brand_name, industry, additional_context)
     
     def generate_intent_analysis(self, brand_name: str, industry: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous version of agenerate_intent_analysis."""
+        return self.generate("intent_analysis", brand_name, industry, additional_context)
+    
+    # Offline scoring through the OpenAI Batch API
+    
+    def generate_all_metrics_offline(
+        self,
+        brands: List[Tuple[str, str, Optional[str]]],
+        poll_interval: float = BATCH_POLL_INTERVAL
+    ) -> Dict[Tuple[str, str, Optional[str]], Dict[str, Dict[str, Any]]]:
         """
-        Generate intent signal analysis for a brand.
+        Generate all five metrics for many brands through the OpenAI Batch API.
+        
+        Batch jobs cost half as much as interactive requests but may take up
+        to 24 hours, so this is meant for offline sweeps such as overnight
+        scoring of a brand universe. Each brand is one request per group of
+        metrics routed to the same model. The call blocks until the job
+        finishes and prints progress while it runs.
         
         Args:
-            brand_name: Name of the brand
-            industry: Industry of the brand
-            additional_context: Additional context about the brand
+            brands: (brand name, industry, additional context) of each brand to score
+            poll_interval: Seconds between job status checks
             
         Returns:
-            Dict: Dictionary with intent signal analysis results
+            Dict: Detailed metric results keyed by metric name, for each brand tuple
+            that was scored successfully
         """
-        template = """
-        You are an expert brand analyst specializing in consumer purchase behavior and intent signals.
-        
-        Analyze the likely intent signals for the brand {brand_name} in the {industry} industry.
-        
-        Additional context: {additional_context}
-        
-        Generate a realistic intent signal analysis that shows the distribution across intent categories:
-        - Awareness (just learning about the brand)
-        - Consideration (actively researching or comparing)
-        - Conversion (ready to purchase or has purchased)
-        
-        For each category, provide key phrases that would indicate this intent level.
-        
-        The analysis should be realistic and specific to the brand and industry.
-        
-        {format_instructions}
-        """
-        
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["brand_name", "industry", "additional_context"],
-            partial_variables={"format_instructions": self.intent_parser.get_format_instructions()}
+        client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        
+        lines = []
+        for index, (brand_name, industry, additional_context) in enumerate(brands):
+            for key in self._metric_groups:
+                lines.append(orjson.dumps({
+                    "custom_id": f"{index}/{key}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._request_body(key, brand_name, industry, additional_context)
+                }))
+        
+        batch_file = client.files.create(file=("metrics_batch.jsonl", b"\n".join(lines)), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
         )
         
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        result = chain.run(brand_name=brand_name, industry=industry, additional_context=additional_context or "No additional context provided.")
-        
-        # Parse the result
-        parsed_result = self.intent_parser.parse(result)
-        return parsed_result.dict()
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            if counts and counts.total:
+                done = counts.completed + counts.failed
+                bar = "#" * (20 * done // counts.total)
+                print(f"Batch {batch.id} {batch.status}: [{bar:<20}] {done}/{counts.total} ({counts.failed} failed)")
+            else:
+                print(f"Batch {batch.id} {batch.status}")
+        
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+        
+        groups: Dict[int, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        output = client.files.content(batch.output_file_id).read() if batch.output_file_id else b""
+        for line in output.splitlines():
+            record = orjson.loads(line)
+            index, key = record["custom_id"].split("/", 1)
+            brand = brands[int(index)]
+            response = record.get("response")
+            if record.get("error") or not response or response["status_code"] != 200:
+                print(f"Error scoring {brand[0]}: {record.get('error') or response}")
+                continue
+            try:
+                groups.setdefault(int(index), {})[key] = self._decoders[key](response["body"]["choices"][0]["message"]["content"])
+            except Exception as e:
+                print(f"Error decoding metrics for {brand[0]}: {e}")
+        
+        # A brand is scored only once every metric group succeeded
+        results = {}
+        for index, brand_groups in groups.items():
+            if len(brand_groups) == len(self._metric_groups):
+                merged = {}
+                for group in brand_groups.values():
+                    merged.update(group)
+                results[brands[index]] = {metric_name: merged[metric_name] for metric_name in METRIC_NAMES}
+        
+        return results
@@ -2,8 +2,69 @@
 Scoring engine for calculating brand resonance scores based on weighted metrics.
 """
 from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+import bisect
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+# Lower score bound of every category but the lowest, ascending
+CATEGORY_THRESHOLDS: Tuple[float, ...] = (20, 30, 40, 50, 60, 70, 80, 90)
+
+# Name and description of each score category, from lowest to highest
+SCORE_CATEGORIES: Tuple[Tuple[str, str], ...] = (
+    ("Critical", "Brand has extremely low resonance and needs complete rethinking"),
+    ("Struggling", "Brand has minimal resonance and requires major intervention"),
+    ("Weak", "Brand has limited resonance with substantial challenges"),
+    ("Emerging", "Brand has begun to establish resonance but needs development"),
+    ("Developing", "Brand has moderate resonance with significant growth potential"),
+    ("Established", "Brand has solid resonance with room for improvement"),
+    ("Strong", "Brand has above-average resonance with some standout metrics"),
+    ("Leading", "Brand has strong resonance across all metrics"),
+    ("Iconic", "Brand has achieved cultural icon status with extremely high resonance"),
+)
+
+_CATEGORY_THRESHOLDS_ARRAY = np.array(CATEGORY_THRESHOLDS, dtype=np.float64)
+
+# Batches with at least this many rows are scored by the Numba kernel, when
+# Numba is installed; smaller ones are not worth leaving NumPy for
+NUMBA_MIN_ROWS = 1000
+
+if njit is not None:
+    # No fastmath: it may reorder or fuse the additions, so scores would no
+    # longer match calculate_score
+    @njit(parallel=True, cache=True)
+    def _score_kernel(metrics_matrix, weights, out_scores):
+        """Sum the weighted metrics of each row left to right, as calculate_score does."""
+        for i in prange(metrics_matrix.shape[0]):
+            score = 0.0
+            for j in range(metrics_matrix.shape[1]):
+                score += metrics_matrix[i, j] * weights[j]
+            out_scores[i] = score
+else:
+    _score_kernel = None
+
+
+def _round_scores(scores: np.ndarray) -> np.ndarray:
+    """
+    Round scores to one decimal place in place, exactly as round(score, 1) does.
+    
+    np.round rounds score * 10, whose rounding error can turn a score just
+    below or above a tie into an exact tie. round() decides on the exact
+    value of the score, so the error of the product is recovered, exactly,
+    as 2 * score - (score * 10 - 8 * score), and settles those ties.
+    """
+    scaled = scores * 10
+    error = 2 * scores - (scaled - 8 * scores)
+    rounded = np.rint(scaled)
+    ties = (scaled - np.floor(scaled) == 0.5) & (error != 0)
+    rounded[ties] = np.where(error[ties] > 0, np.ceil(scaled[ties]), np.floor(scaled[ties]))
+    return np.divide(rounded, 10, out=scores)
+
 
 class ResonanceScorer:
     """
@@ -28,31 +89,147 @@ class ResonanceScorer:
         """Initialize the ResonanceScorer."""
         # Validate that weights sum to 1.0
         total_weight = sum(self.METRIC_WEIGHTS.values())
-        if not np.isclose(total_weight, 1.0):
+        if abs(total_weight - 1.0) > 1e-9:
             raise ValueError(f"Metric weights must sum to 1.0, got {total_weight}")
+        
+        # Weights as a vector in a fixed metric order, for vectorized scoring
+        self._metric_order: Tuple[str, ...] = tuple(self.METRIC_WEIGHTS)
+        self._metric_keys = frozenset(self._metric_order)
+        self._weights = np.fromiter(
+            (self.METRIC_WEIGHTS[metric_name] for metric_name in self._metric_order),
+            dtype=np.float64,
+            count=len(self._metric_order)
+        )
+        # Refreshes and breakdowns re-score the same metrics, so memoize scores
+        # per instance on the metric values in metric order
+        self._cached_score = lru_cache(maxsize=1024)(self._score_values)
+
+    def _score_values(self, values: Tuple[float, ...]) -> float:
+        """Calculate the rounded weighted score of metric values in metric order."""
+        # Sum left to right in plain floats: a dot product adds the terms in
+        # another order, which moves scores that lie near a rounding boundary
+        weighted_score = 0.0
+        for metric_score, weight in zip(values, self.METRIC_WEIGHTS.values()):
+            weighted_score += metric_score * weight
+        return round(weighted_score, 1)
 
-    def calculate_score(self, metrics: Dict[str, float]) -> float:
+    def calculate_score(self, metrics: Dict[str, float], validate: bool = True) -> float:
         """
         Calculate the overall resonance score based on the provided metrics.
         
         Args:
             metrics: Dictionary containing scores for each metric (0-100)
+            validate: Whether to validate the metrics first; callers that have
+                already validated them, such as batch jobs, can skip it
             
         Returns:
             float: Overall resonance score (0-100)
         """
         # Validate input metrics
-        self._validate_metrics(metrics)
+        if validate:
+            self._validate_metrics(metrics)
         
-        # Calculate weighted score
-        weighted_score = 0.0
-        for metric_name, weight in self.METRIC_WEIGHTS.items():
-            if metric_name in metrics:
-                metric_score = metrics[metric_name]
-                weighted_score += metric_score * weight
+        # Calculate weighted score, rounded to 1 decimal place
+        return self._cached_score(tuple(metrics[metric_name] for metric_name in self._metric_order))
+    
+    def metrics_to_matrix(self, metrics_list: List[Dict[str, float]]) -> np.ndarray:
+        """
+        Stack metric dictionaries into a matrix for calculate_scores_batch.
         
-        # Round to 1 decimal place
-        return round(weighted_score, 1)
+        Args:
+            metrics_list: Dictionaries containing scores for each metric
+            
+        Returns:
+            np.ndarray: (N, 5) float64 array with one row per dictionary, in
+            the scorer's metric order
+            
+        Raises:
+            ValueError: If a dictionary is missing a metric
+        """
+        try:
+            values = np.fromiter(
+                (metrics[metric_name] for metrics in metrics_list for metric_name in self._metric_order),
+                dtype=np.float64,
+                count=len(metrics_list) * len(self._metric_order)
+            )
+        except KeyError as e:
+            raise ValueError(f"Missing required metric: {e.args[0]}") from None
+        return values.reshape(len(metrics_list), len(self._metric_order))
+    
+    def _check_metrics_matrix(self, metrics_matrix: np.ndarray, validate: bool) -> np.ndarray:
+        """
+        Convert a metrics matrix to float64 and check its shape and, optionally, its scores.
+        
+        Raises:
+            ValueError: If the matrix has the wrong shape or invalid scores
+        """
+        metrics_matrix = np.ascontiguousarray(metrics_matrix, dtype=np.float64)
+        if metrics_matrix.ndim != 2 or metrics_matrix.shape[1] != len(self._metric_order):
+            raise ValueError(f"Metrics matrix must have shape (N, {len(self._metric_order)}), got {metrics_matrix.shape}")
+        
+        if validate:
+            invalid = ~((metrics_matrix >= 0) & (metrics_matrix <= 100))
+            if invalid.any():
+                row, column = np.argwhere(invalid)[0]
+                raise ValueError(
+                    f"Metric {self._metric_order[column]} must be between 0 and 100, "
+                    f"got {metrics_matrix[row, column]} in row {row}"
+                )
+        return metrics_matrix
+    
+    def calculate_scores_batch(self, metrics_matrix: np.ndarray, validate: bool = True) -> np.ndarray:
+        """
+        Calculate the overall resonance scores of many brands at once.
+        
+        Every score equals calculate_score of the same row: the weighted
+        metrics are summed in float64 in metric order and rounded like
+        round(). Batches of NUMBA_MIN_ROWS rows or more are summed by a
+        compiled kernel when Numba is installed.
+        
+        Args:
+            metrics_matrix: (N, 5) array of metric scores (0-100), with columns
+                in the scorer's metric order, e.g. from metrics_to_matrix
+            validate: Whether to check that every score is between 0 and 100
+            
+        Returns:
+            np.ndarray: Overall resonance score (0-100) of each row, rounded to
+            one decimal place
+            
+        Raises:
+            ValueError: If the matrix has the wrong shape or invalid scores
+        """
+        metrics_matrix = self._check_metrics_matrix(metrics_matrix, validate)
+        if _score_kernel is not None and len(metrics_matrix) >= NUMBA_MIN_ROWS:
+            scores = np.empty(len(metrics_matrix), dtype=np.float64)
+            _score_kernel(metrics_matrix, self._weights, scores)
+        else:
+            # Add one column at a time rather than taking a matrix-vector
+            # product, whose summation order changes the rounded scores
+            scores = metrics_matrix[:, 0] * self._weights[0]
+            for column in range(1, len(self._weights)):
+                scores += metrics_matrix[:, column] * self._weights[column]
+        return _round_scores(scores)
+    
+    def score_and_categorize_batch(self, metrics_matrix: np.ndarray, validate: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate the overall resonance scores and categories of many brands at once.
+        
+        Equivalent to calculate_scores_batch followed by get_score_categories.
+        
+        Args:
+            metrics_matrix: (N, 5) array of metric scores (0-100), with columns
+                in the scorer's metric order
+            validate: Whether to check that every score is between 0 and 100
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Score of each row and the index into
+            SCORE_CATEGORIES of its category
+            
+        Raises:
+            ValueError: If the matrix has the wrong shape or invalid scores
+        """
+        scores = self.calculate_scores_batch(metrics_matrix, validate)
+        return scores, self.get_score_categories(scores)
     
     def _validate_metrics(self, metrics: Dict[str, float]) -> None:
         """
@@ -64,10 +241,12 @@ class ResonanceScorer:
         Raises:
             ValueError: If metrics are invalid
         """
-        # Check for missing metrics
-        for metric_name in self.METRIC_WEIGHTS.keys():
-            if metric_name not in metrics:
-                raise ValueError(f"Missing required metric: {metric_name}")
+        # Check for missing metrics with one set difference, reporting the
+        # first missing one in metric order
+        missing = self._metric_keys - metrics.keys()
+        if missing:
+            metric_name = next(name for name in self._metric_order if name in missing)
+            raise ValueError(f"Missing required metric: {metric_name}")
         
         # Check for invalid metric values
         for metric_name, score in metrics.items():
@@ -87,11 +266,14 @@ class ResonanceScorer:
         Returns:
             List[Dict]: List of dictionaries with metric details
         """
+        # The overall score is the same for every metric, so compute it once
+        overall_score = self.calculate_score(metrics)
+        
         breakdown = []
         for metric_name, weight in self.METRIC_WEIGHTS.items():
             score = metrics.get(metric_name, 0)
             contribution = score * weight
-            percentage = (contribution / self.calculate_score(metrics)) * 100 if self.calculate_score(metrics) > 0 else 0
+            percentage = (contribution / overall_score) * 100 if overall_score > 0 else 0
             
             breakdown.append({
                 "name": metric_name,
@@ -115,21 +297,16 @@ class ResonanceScorer:
         Returns:
             Tuple[str, str]: Category name and description
         """
-        if score >= 90:
-            return ("Iconic", "Brand has achieved cultural icon status with extremely high resonance")
-        elif score >= 80:
-            return ("Leading", "Brand has strong resonance across all metrics")
-        elif score >= 70:
-            return ("Strong", "Brand has above-average resonance with some standout metrics")
-        elif score >= 60:
-            return ("Established", "Brand has solid resonance with room for improvement")
-        elif score >= 50:
-            return ("Developing", "Brand has moderate resonance with significant growth potential")
-        elif score >= 40:
-            return ("Emerging", "Brand has begun to establish resonance but needs development")
-        elif score >= 30:
-            return ("Weak", "Brand has limited resonance with substantial challenges")
-        elif score >= 20:
-            return ("Struggling", "Brand has minimal resonance and requires major intervention")
-        else:
-            return ("Critical", "Brand has extremely low resonance and needs complete rethinking")
+        return SCORE_CATEGORIES[bisect.bisect_right(CATEGORY_THRESHOLDS, score)]
+    
+    def get_score_categories(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Get the category index of many resonance scores at once.
+        
+        Args:
+            scores: Resonance scores (0-100)
+            
+        Returns:
+            np.ndarray: Index into SCORE_CATEGORIES of each score's category
+        """
+        return np.searchsorted(_CATEGORY_THRESHOLDS_ARRAY, scores, side="right")
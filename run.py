@@ -15,7 +15,7 @@ def run_api():
     port = int(os.getenv("API_PORT", "8000"))
     
     print(f"Starting Brand Resonance API on http://{host}:{port}")
-    uvicorn.run("api.main:app", host=host, port=port, reload=True)
+    uvicorn.run("api.main:app", host=host, port=port, reload=True, loop="uvloop", http="httptools")
 
 def run_frontend():
     """Run the React frontend development server."""
@@ -0,0 +1,16 @@
+"""
+Shared fixtures for the API tests.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main as main
+from api.store import MemoryStore
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client of the API backed by an empty in-memory store and response cache."""
+    monkeypatch.setattr(main, "store", MemoryStore([], data_dir=str(tmp_path)))
+    monkeypatch.setattr(main, "_response_cache", main.ResponseCache(main.RESPONSE_CACHE_MAX_BYTES))
+    return TestClient(main.app)
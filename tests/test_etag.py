@@ -0,0 +1,43 @@
+"""
+Tests for ETag validation of cached GET responses.
+"""
+
+
+def test_matching_etag_gets_not_modified(client):
+    brand = client.post("/brands/", json={"name": "Acme", "industry": "Retail"}).json()
+    
+    first = client.get(f"/brands/{brand['id']}")
+    etag = first.headers["etag"]
+    second = client.get(f"/brands/{brand['id']}", headers={"If-None-Match": etag})
+    
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+def test_etag_changes_after_update(client):
+    brand = client.post("/brands/", json={"name": "Acme", "industry": "Retail"}).json()
+    etag = client.get(f"/brands/{brand['id']}").headers["etag"]
+    
+    client.put(f"/brands/{brand['id']}", json={"name": "Acme", "industry": "Grocery"})
+    response = client.get(f"/brands/{brand['id']}", headers={"If-None-Match": etag})
+    
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["industry"] == "Grocery"
+
+
+def test_compressed_representation_has_its_own_etag(client):
+    for index in range(20):
+        client.post("/brands/", json={"name": f"Brand {index}", "industry": "Retail"})
+    
+    plain = client.get("/brands/", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/brands/", headers={"Accept-Encoding": "gzip"})
+    
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] != plain.headers["etag"]
+    assert client.get("/brands/", headers={"Accept-Encoding": "gzip", "If-None-Match": plain.headers["etag"]}).status_code == 200
+
+
+def test_missing_item_is_not_found(client):
+    assert client.get("/brands/missing").status_code == 404
@@ -0,0 +1,150 @@
+"""
+Tests for the caches of LLM results in LLMMetricGenerator.
+"""
+import asyncio
+
+import orjson
+import pytest
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+from models.llm_integration import ANALYST_GUIDELINES, LLMMetricGenerator, SemanticCache
+
+
+def make_generator(tmp_path, calls, **kwargs):
+    """Create a generator with a disk cache in tmp_path whose LLM calls are recorded in calls."""
+    generator = LLMMetricGenerator(semantic_cache_threshold=None, disk_cache_dir=str(tmp_path), **kwargs)
+    
+    async def run_analysis(name, brand_name, industry, additional_context):
+        calls.append((name, brand_name, industry, additional_context))
+        return {"call": len(calls)}
+    
+    generator._run_analysis = run_analysis
+    return generator
+
+
+def test_disk_cache_serves_repeated_requests(tmp_path):
+    calls = []
+    generator = make_generator(tmp_path, calls)
+    
+    first = asyncio.run(generator.agenerate("topic_analysis", "Acme", "Retail", "context"))
+    second = asyncio.run(generator.agenerate("topic_analysis", "Acme", "Retail", "context"))
+    
+    assert first == second == {"call": 1}
+    assert len(calls) == 1
+
+
+def test_system_messages_start_with_the_shared_guidelines(tmp_path):
+    generator = make_generator(tmp_path, [])
+    
+    # OpenAI caches prompt prefixes, so the shared part must come first
+    assert all(request.system_prompt.startswith(ANALYST_GUIDELINES) for request in generator._requests.values())
+
+
+def test_disk_cache_hands_out_copies(tmp_path):
+    calls = []
+    generator = make_generator(tmp_path, calls)
+    
+    first = asyncio.run(generator.agenerate("topic_analysis", "Acme", "Retail"))
+    first["brand_id"] = "annotated by the caller"
+    
+    assert asyncio.run(generator.agenerate("topic_analysis", "Acme", "Retail")) == {"call": 1}
+
+
+def test_disk_cache_misses_after_routing_change(tmp_path):
+    calls = []
+    asyncio.run(make_generator(tmp_path, calls).agenerate("topic_analysis", "Acme", "Retail"))
+    
+    rerouted = make_generator(tmp_path, calls, model_routing={"topic_analysis": "gpt-4o"})
+    result = asyncio.run(rerouted.agenerate("topic_analysis", "Acme", "Retail"))
+    
+    assert result == {"call": 2}
+    assert len(calls) == 2
+
+
+def test_disk_cache_normalizes_every_key_field(tmp_path):
+    calls = []
+    generator = make_generator(tmp_path, calls)
+    
+    asyncio.run(generator.agenerate("topic_analysis", "Acme ", "Retail", "Loyal fans "))
+    result = asyncio.run(generator.agenerate("topic_analysis", "acme", " retail", "loyal fans"))
+    
+    assert result == {"call": 1}
+    assert len(calls) == 1
+
+
+def test_semantic_cache_normalizes_context(tmp_path):
+    calls = []
+    generator = make_generator(tmp_path, calls)
+    generator.disk_cache = None
+    generator.semantic_cache = SemanticCache(embed=None)
+    
+    asyncio.run(generator.agenerate("topic_analysis", "Acme", "Retail", "Loyal fans"))
+    # Matching contexts are exact hits, so nothing is embedded
+    result = asyncio.run(generator.agenerate("topic_analysis", "ACME", "Retail", " loyal fans\n"))
+    
+    assert result == {"call": 1}
+    assert len(calls) == 1
+
+
+METRIC_NAMES = ("conversational_depth", "community_spread", "emotional_intensity", "intent_signals", "advocacy_language")
+
+
+def streaming_generator(tmp_path, results):
+    """Create a generator whose single metrics call streams results in small chunks."""
+    generator = LLMMetricGenerator(semantic_cache_threshold=None, disk_cache_dir=str(tmp_path), model_routing={})
+    raw = orjson.dumps(results)
+    
+    async def arun(body, on_chunk=None):
+        buffer = bytearray()
+        for start in range(0, len(raw), 16):
+            data = raw[start:start + 16]
+            buffer += data
+            if on_chunk is not None:
+                on_chunk(buffer, data)
+        return bytes(buffer)
+    
+    generator._arun = arun
+    return generator
+
+
+def metric(score, reasoning="reason"):
+    return {"score": score, "reasoning": reasoning, "key_insights": ["insight"]}
+
+
+async def collect(stream):
+    return [item async for item in stream]
+
+
+def test_stream_yields_every_metric(tmp_path):
+    results = {name: metric(50 + index) for index, name in enumerate(METRIC_NAMES)}
+    generator = streaming_generator(tmp_path, results)
+    
+    items = asyncio.run(collect(generator.astream_all_metrics("Acme", "Retail")))
+    
+    assert dict(items) == results
+    assert [name for name, _ in items] == list(METRIC_NAMES)
+
+
+@pytest.mark.parametrize("invalid", [
+    metric("42"),
+    metric(142),
+    # Without msgspec, only scores are checked
+    pytest.param(metric(42, reasoning=7), marks=pytest.mark.skipif(msgspec is None, reason="needs msgspec"))
+])
+def test_stream_rejects_invalid_early_metric(tmp_path, invalid):
+    results = {name: metric(50) for name in METRIC_NAMES}
+    results["conversational_depth"] = invalid
+    generator = streaming_generator(tmp_path, results)
+    yielded = []
+    
+    async def consume():
+        async for item in generator.astream_all_metrics("Acme", "Retail"):
+            yielded.append(item)
+    
+    with pytest.raises(ValueError if msgspec is None else msgspec.ValidationError):
+        asyncio.run(consume())
+    assert "conversational_depth" not in dict(yielded)
@@ -0,0 +1,40 @@
+"""
+Tests for the cache of serialized GET responses.
+"""
+import api.main as main
+from api.main import ResponseCache
+
+
+def test_newer_version_replaces_cached_view():
+    cache = ResponseCache(max_bytes=1000)
+    cache.put("brands", None, 1, b"x" * 100)
+    cache.put("brands", None, 2, b"y" * 50)
+    
+    assert len(cache) == 1
+    assert cache.size == 50
+    assert cache.get("brands", None, 1) is None
+    assert cache.get("brands", None, 2).payload == b"y" * 50
+
+
+def test_cache_is_bounded_by_bytes():
+    cache = ResponseCache(max_bytes=100)
+    cache.put("brands", "a", 1, b"a" * 40)
+    cache.put("brands", "b", 1, b"b" * 40)
+    # Touching "a" makes "b" the least recently used view
+    cache.get("brands", "a", 1)
+    entry = cache.put("brands", "c", 1, b"c" * 30)
+    cache.add_compressed(entry, "gzip", b"z" * 20)
+    
+    assert cache.get("brands", "b", 1) is None
+    assert cache.get("brands", "a", 1) is not None
+    assert cache.size == 90
+
+
+def test_mutations_do_not_accumulate_cached_lists(client):
+    for name in ("Acme", "Globex", "Initech"):
+        client.post("/brands/", json={"name": name, "industry": "Retail"})
+        response = client.get("/brands/", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+    
+    assert len(response.json()) == 3
+    assert len(main._response_cache) == 1
@@ -0,0 +1,70 @@
+"""
+Tests for listing resonance results.
+"""
+import asyncio
+
+import api.main as main
+
+
+def add_results(count: int, brand_id: str = "b1"):
+    """Store count minimal results for a brand in the test store."""
+    async def scenario():
+        for index in range(count):
+            result_id = f"r{index:04d}"
+            await main.store.set("resonance_results", result_id, {"id": result_id, "brand_id": brand_id, "notes": "x" * 100})
+            await main.store.append("results_by_brand", brand_id, result_id)
+    
+    asyncio.run(scenario())
+
+
+def test_small_result_list_is_cached_and_compressed(client):
+    add_results(20)
+    
+    response = client.get("/results/", headers={"Accept-Encoding": "br"})
+    
+    assert response.headers["content-encoding"] == "br"
+    assert "etag" in response.headers
+    assert [result["id"] for result in response.json()] == [f"r{index:04d}" for index in range(20)]
+    assert len(main._response_cache) == 1
+
+
+def test_large_result_list_is_streamed(client, monkeypatch):
+    monkeypatch.setattr(main, "STREAM_CHUNK_SIZE", 256)
+    monkeypatch.setattr(main, "BUFFERED_LIST_MAX_SIZE", 1024)
+    add_results(50)
+    
+    response = client.get("/results/", params={"brand_id": "b1"}, headers={"Accept-Encoding": "gzip, br"})
+    
+    assert "etag" not in response.headers
+    assert "content-length" not in response.headers
+    assert [result["id"] for result in response.json()] == [f"r{index:04d}" for index in range(50)]
+    assert len(main._response_cache) == 0
+
+
+def test_results_stream_as_ndjson(client):
+    add_results(3)
+    
+    response = client.get("/results/", headers={"Accept": "application/x-ndjson"})
+    
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(response.text.splitlines()) == 3
+
+
+def test_brand_result_list_sees_result_appended_after_it_was_stored(client):
+    add_results(2)
+    client.get("/results/", params={"brand_id": "b1"})
+    
+    async def store_result():
+        await main.store.set("resonance_results", "r0002", {"id": "r0002", "brand_id": "b1"})
+    
+    async def append_result():
+        await main.store.append("results_by_brand", "b1", "r0002")
+    
+    # A request between analyze_brand's two writes caches the list without the new result
+    asyncio.run(store_result())
+    assert len(client.get("/results/", params={"brand_id": "b1"}).json()) == 2
+    asyncio.run(append_result())
+    
+    response = client.get("/results/", params={"brand_id": "b1"})
+    
+    assert [result["id"] for result in response.json()] == ["r0000", "r0001", "r0002"]
@@ -0,0 +1,95 @@
+"""
+Tests for the resonance scoring engine.
+"""
+import random
+
+import numpy as np
+import pytest
+
+from models.scoring_engine import NUMBA_MIN_ROWS, SCORE_CATEGORIES, ResonanceScorer
+
+
+def reference_score(metrics):
+    """Weighted score as originally defined: terms summed left to right in weight order."""
+    weighted_score = 0.0
+    for metric_name, weight in ResonanceScorer.METRIC_WEIGHTS.items():
+        weighted_score += metrics[metric_name] * weight
+    return round(weighted_score, 1)
+
+
+def as_metrics(values):
+    return dict(zip(ResonanceScorer.METRIC_WEIGHTS, values))
+
+
+@pytest.mark.parametrize("values, expected", [
+    ([65, 47, 69, 56, 64], 60.2),
+    ([66, 64, 83, 78, 75], 74.9),
+    ([100, 43, 92, 1, 24], 41.1),
+    ([82, 93, 84, 71, 52], 73.2),
+])
+def test_score_rounding_is_pinned(values, expected):
+    assert ResonanceScorer().calculate_score(as_metrics(values)) == expected
+
+
+def test_score_matches_reference_summation():
+    scorer = ResonanceScorer()
+    rng = random.Random(0)
+    for _ in range(20000):
+        metrics = as_metrics([rng.randint(0, 100) for _ in range(5)])
+        assert scorer.calculate_score(metrics) == reference_score(metrics)
+
+
+# Below NUMBA_MIN_ROWS the batch is scored by NumPy, above it by the Numba kernel if installed
+@pytest.mark.parametrize("rows", [NUMBA_MIN_ROWS - 1, 20 * NUMBA_MIN_ROWS])
+@pytest.mark.parametrize("decimals", [0, 1])
+def test_batch_scores_match_calculate_score(rows, decimals):
+    scorer = ResonanceScorer()
+    rng = np.random.default_rng(rows + decimals)
+    metrics_matrix = np.round(rng.uniform(0, 100, (rows, 5)), decimals)
+    
+    scores, categories = scorer.score_and_categorize_batch(metrics_matrix)
+    
+    expected = [scorer.calculate_score(as_metrics(values)) for values in metrics_matrix.tolist()]
+    assert scores.tolist() == expected
+    assert [SCORE_CATEGORIES[index][0] for index in categories] == [scorer.get_score_category(score)[0] for score in expected]
+
+
+def test_score_category_boundaries():
+    scorer = ResonanceScorer()
+    assert scorer.get_score_category(19.9)[0] == "Critical"
+    assert scorer.get_score_category(20.0)[0] == "Struggling"
+    assert scorer.get_score_category(90.0)[0] == "Iconic"
+
+
+def test_invalid_metrics_are_rejected():
+    scorer = ResonanceScorer()
+    with pytest.raises(ValueError, match="Missing required metric: community_spread"):
+        scorer.calculate_score({"conversational_depth": 50})
+    with pytest.raises(ValueError, match="between 0 and 100"):
+        scorer.calculate_score(as_metrics([50, 50, 50, 50, 101]))
+
+
+def reference_breakdown(metrics):
+    """Metric breakdown as originally defined."""
+    overall_score = reference_score(metrics)
+    breakdown = []
+    for metric_name, weight in ResonanceScorer.METRIC_WEIGHTS.items():
+        contribution = metrics[metric_name] * weight
+        percentage = (contribution / overall_score) * 100 if overall_score > 0 else 0
+        breakdown.append({
+            "name": metric_name,
+            "score": metrics[metric_name],
+            "weight": weight,
+            "contribution": contribution,
+            "percentage": round(percentage, 1)
+        })
+    breakdown.sort(key=lambda x: x["contribution"], reverse=True)
+    return breakdown
+
+
+def test_breakdown_matches_reference():
+    scorer = ResonanceScorer()
+    rng = random.Random(1)
+    for _ in range(20000):
+        metrics = as_metrics([rng.randint(0, 100) for _ in range(5)])
+        assert scorer.get_metric_breakdown(metrics) == reference_breakdown(metrics)
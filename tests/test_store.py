@@ -0,0 +1,136 @@
+"""
+Tests for the storage backends.
+"""
+import asyncio
+import os
+import threading
+import time
+
+import fakeredis
+import orjson
+import pytest
+
+from api.store import MemoryStore, RedisStore
+
+
+def redis_store(server: fakeredis.FakeServer) -> RedisStore:
+    """Create a RedisStore connected to an in-process fake Redis server."""
+    store = RedisStore("redis://unused")
+    store._redis = fakeredis.FakeAsyncRedis(server=server)
+    return store
+
+
+def test_memory_store_persists_across_restarts(tmp_path):
+    async def scenario():
+        store = MemoryStore(["brands"], data_dir=str(tmp_path))
+        await store.start()
+        await store.set("brands", "b1", {"name": "Acme"})
+        await store.close()
+        
+        reopened = MemoryStore(["brands"], data_dir=str(tmp_path))
+        await reopened.start()
+        try:
+            return await reopened.get("brands", "b1")
+        finally:
+            await reopened.close()
+    
+    assert asyncio.run(scenario()) == {"name": "Acme"}
+
+
+def test_memory_store_refuses_corrupt_file(tmp_path):
+    path = tmp_path / "brands.json"
+    path.write_bytes(b'{"b1": {"name": "Ac')
+    store = MemoryStore(["brands"], data_dir=str(tmp_path))
+    
+    with pytest.raises(ValueError, match="Corrupt data file"):
+        asyncio.run(store.start())
+    assert path.read_bytes() == b'{"b1": {"name": "Ac'
+
+
+def test_memory_store_failed_write_keeps_previous_file(tmp_path, monkeypatch):
+    store = MemoryStore(["brands"], data_dir=str(tmp_path))
+    store._write_payload(b'{"b1": 1}', "brands")
+    
+    def fail(fd):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(os, "fsync", fail)
+    with pytest.raises(OSError):
+        store._write_payload(b'{"b1": 2, "b2"', "brands")
+    
+    assert (tmp_path / "brands.json").read_bytes() == b'{"b1": 1}'
+    assert os.listdir(tmp_path) == ["brands.json"]
+
+
+class SlowMemoryStore(MemoryStore):
+    """MemoryStore whose background file writes take a while, recording when one starts."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writing = threading.Event()
+    
+    def _write_payload(self, payload: bytes, name: str):
+        if threading.current_thread() is not threading.main_thread():
+            self.writing.set()
+            time.sleep(0.2)
+        super()._write_payload(payload, name)
+
+
+def test_memory_store_close_waits_for_running_flush(tmp_path):
+    async def scenario():
+        store = SlowMemoryStore(["brands"], data_dir=str(tmp_path), flush_interval=0.01)
+        await store.start()
+        await store.set("brands", "b1", {"version": 1})
+        while not store.writing.is_set():
+            await asyncio.sleep(0.01)
+        
+        # Mutate while the background flush is still writing, then close
+        await store.set("brands", "b1", {"version": 2})
+        await store.close()
+        # A write left running by close would land after this point
+        await asyncio.sleep(0.3)
+    
+    asyncio.run(scenario())
+    assert orjson.loads((tmp_path / "brands.json").read_bytes()) == {"b1": {"version": 2}}
+    assert os.listdir(tmp_path) == ["brands.json"]
+
+
+@pytest.mark.parametrize("backend", ["memory", "redis"])
+def test_version_only_changes_on_mutation(backend, tmp_path):
+    async def scenario():
+        if backend == "memory":
+            store = MemoryStore([], data_dir=str(tmp_path))
+        else:
+            store = redis_store(fakeredis.FakeServer())
+        
+        assert await store.setdefault("meta", "flag", True)
+        version = await store.version("meta")
+        assert not await store.setdefault("meta", "flag", False)
+        assert not await store.delete("meta", "missing")
+        assert await store.version("meta") == version
+        
+        assert await store.delete("meta", "flag")
+        assert await store.version("meta") > version
+    
+    asyncio.run(scenario())
+
+
+def test_redis_workers_share_state():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        first, second = redis_store(server), redis_store(server)
+        
+        # Only one worker claims a key, as the startup index rebuild relies on
+        claims = await asyncio.gather(
+            first.setdefault("meta", "indexes_built", True),
+            second.setdefault("meta", "indexes_built", True)
+        )
+        assert sorted(claims) == [False, True]
+        
+        await first.set("brands", "b1", {"name": "Acme"})
+        await first.append("results_by_brand", "b1", "r1")
+        assert await second.get("brands", "b1") == {"name": "Acme"}
+        assert await second.get_list("results_by_brand", "b1") == ["r1"]
+        assert await second.version("brands") == await first.version("brands") == 1
+    
+    asyncio.run(scenario())
@@ -1,7 +1,10 @@
 """
 Utility functions for data processing and analysis.
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Any
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+import os
 import numpy as np
 import pandas as pd
 from sklearn.feature_extraction.text import CountVectorizer
@@ -11,17 +14,32 @@ from nltk.sentiment import SentimentIntensityAnalyzer
 import spacy
 import re
 
-# Download necessary NLTK data
 try:
-    nltk.data.find('vader_lexicon')
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Download necessary NLTK data (find() takes resource paths, not package names)
+try:
+    nltk.data.find('sentiment/vader_lexicon.zip')
 except LookupError:
     nltk.download('vader_lexicon')
 
 try:
-    nltk.data.find('punkt')
+    nltk.data.find('tokenizers/punkt')
 except LookupError:
     nltk.download('punkt')
 
+# Sentiment analyzer shared by all calls, since each instance loads the VADER lexicon
+_SIA = SentimentIntensityAnalyzer()
+
+# Sentiment buckets of VADER compound scores, from lowest to highest, and the
+# lower bound of every bucket but the first. A score equal to one of the
+# negative bounds belongs to the bucket below it, hence nextafter for the
+# positive ones, which are inclusive.
+_SENTIMENT_LABELS = ("Very Negative", "Negative", "Neutral", "Positive", "Very Positive")
+_SENTIMENT_BOUNDS = np.array([-0.5, -0.1, np.nextafter(0.1, -1.0), np.nextafter(0.5, -1.0)])
+
 # Load spaCy model
 try:
     nlp = spacy.load("en_core_web_sm")
@@ -32,6 +50,170 @@ except OSError:
     nlp = spacy.load("en_core_web_sm")
 
 
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile keywords into one pattern that finds any of them as a substring."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Intent signal keywords
+INTENT_KEYWORDS: Dict[str, List[str]] = {
+    "awareness": [
+        "heard about", "what is", "who is", "learn more", "tell me about",
+        "new", "discover", "found out", "just saw", "introduction"
+    ],
+    "consideration": [
+        "compare", "versus", "vs", "better than", "alternative", "review",
+        "rating", "price", "cost", "worth it", "features", "thinking about",
+        "considering", "should I", "pros and cons"
+    ],
+    "conversion": [
+        "bought", "purchased", "ordered", "buy", "get", "where to buy",
+        "discount", "coupon", "deal", "sale", "in stock", "shipping",
+        "delivery", "add to cart", "checkout"
+    ]
+}
+
+# Advocacy keywords
+ADVOCACY_KEYWORDS: List[str] = [
+    "recommend", "love", "best", "amazing", "excellent", "awesome",
+    "great", "fantastic", "outstanding", "superb", "favorite", "perfect",
+    "must-have", "must try", "life-changing", "game-changer", "changed my life",
+    "never going back", "loyal", "fan", "advocate", "evangelist", "ambassador"
+]
+
+# Major regions and countries
+REGION_KEYWORDS: Dict[str, List[str]] = {
+    "North America": ["usa", "united states", "america", "canada", "mexico"],
+    "Europe": ["europe", "uk", "united kingdom", "germany", "france", "italy", "spain"],
+    "Asia": ["asia", "china", "japan", "india", "korea", "singapore"],
+    "Australia/Oceania": ["australia", "new zealand", "oceania"],
+    "South America": ["brazil", "argentina", "colombia", "chile", "peru"],
+    "Africa": ["africa", "south africa", "nigeria", "kenya", "egypt"],
+    "Middle East": ["middle east", "uae", "dubai", "saudi arabia", "israel"]
+}
+
+# Demographic keywords
+DEMOGRAPHIC_KEYWORDS: Dict[str, Dict[str, List[str]]] = {
+    "age_groups": {
+        "Under 18": ["teen", "teenager", "high school", "young", "kid", "child"],
+        "18-24": ["college", "university", "student", "young adult", "early 20s"],
+        "25-34": ["young professional", "millennial", "30s", "thirties", "late 20s"],
+        "35-44": ["parent", "family", "40s", "forties", "mid-career"],
+        "45-54": ["middle-aged", "experienced", "50s", "fifties"],
+        "55+": ["senior", "retired", "elder", "boomer", "older"]
+    },
+    "gender": {
+        "Male": ["man", "men", "male", "guy", "boy", "father", "dad", "husband", "boyfriend"],
+        "Female": ["woman", "women", "female", "girl", "mother", "mom", "wife", "girlfriend"],
+        "Other/Unspecified": ["non-binary", "they", "them", "person", "people"]
+    },
+    "income_levels": {
+        "Low": ["budget", "affordable", "cheap", "low income", "struggling", "poor"],
+        "Middle": ["middle class", "average", "moderate", "standard"],
+        "High": ["luxury", "premium", "high-end", "wealthy", "rich", "affluent"]
+    }
+}
+
+# Distributions reported when no text mentions a region, or a subcategory of
+# a demographic category. Read-only, so callers get copies.
+_REGION_DEFAULTS = MappingProxyType({
+    "North America": 40.0,
+    "Europe": 25.0,
+    "Asia": 20.0,
+    "Australia/Oceania": 5.0,
+    "South America": 5.0,
+    "Africa": 3.0,
+    "Middle East": 2.0
+})
+_DEMOGRAPHIC_DEFAULTS = MappingProxyType({
+    "age_groups": MappingProxyType({
+        "Under 18": 5.0,
+        "18-24": 15.0,
+        "25-34": 30.0,
+        "35-44": 25.0,
+        "45-54": 15.0,
+        "55+": 10.0
+    }),
+    "gender": MappingProxyType({
+        "Male": 48.0,
+        "Female": 48.0,
+        "Other/Unspecified": 4.0
+    }),
+    "income_levels": MappingProxyType({
+        "Low": 30.0,
+        "Middle": 50.0,
+        "High": 20.0
+    })
+})
+
+# Distributions reported for an empty list of texts
+_ZERO_REGIONS = MappingProxyType(dict.fromkeys(REGION_KEYWORDS, 0.0))
+_ZERO_DEMOGRAPHICS = MappingProxyType({
+    category: MappingProxyType(dict.fromkeys(subcategories, 0.0))
+    for category, subcategories in DEMOGRAPHIC_KEYWORDS.items()
+})
+
+# Compiled keyword matchers, so each text is scanned once per bucket instead
+# of once per keyword
+_INTENT_PATTERNS = {intent: _keyword_pattern(keywords) for intent, keywords in INTENT_KEYWORDS.items()}
+_ADVOCACY_PATTERN = _keyword_pattern(ADVOCACY_KEYWORDS)
+_REGION_PATTERNS = {region: _keyword_pattern(keywords) for region, keywords in REGION_KEYWORDS.items()}
+
+# Demographic matchers as one flat (category, subcategory, pattern) table, so
+# counting a text is a single loop rather than a walk of the nested keywords.
+# Counts are kept in a flat list in the same order.
+_DEMOGRAPHIC_TABLE = tuple(
+    (category, subcategory, _keyword_pattern(keywords))
+    for category, subcategories in DEMOGRAPHIC_KEYWORDS.items()
+    for subcategory, keywords in subcategories.items()
+)
+
+# Keyword buckets of the corpus-wide scan in analyze_corpus, in the order of
+# their counts: each intent, advocacy, each region, then each demographic
+# subcategory in _DEMOGRAPHIC_TABLE order
+_BUCKET_KEYWORDS: List[List[str]] = (
+    list(INTENT_KEYWORDS.values())
+    + [ADVOCACY_KEYWORDS]
+    + list(REGION_KEYWORDS.values())
+    + [keywords for subcategories in DEMOGRAPHIC_KEYWORDS.values() for keywords in subcategories.values()]
+)
+_BUCKET_PATTERNS = (
+    *_INTENT_PATTERNS.values(),
+    _ADVOCACY_PATTERN,
+    *_REGION_PATTERNS.values(),
+    *(pattern for _, _, pattern in _DEMOGRAPHIC_TABLE)
+)
+_INTENT_BUCKETS = slice(0, len(INTENT_KEYWORDS))
+_ADVOCACY_BUCKET = _INTENT_BUCKETS.stop
+_REGION_BUCKETS = slice(_ADVOCACY_BUCKET + 1, _ADVOCACY_BUCKET + 1 + len(REGION_KEYWORDS))
+_DEMOGRAPHIC_BUCKETS = slice(_REGION_BUCKETS.stop, len(_BUCKET_KEYWORDS))
+
+
+def _keyword_automaton() -> Optional["ahocorasick.Automaton"]:
+    """
+    Build an Aho-Corasick automaton of every bucket keyword, or None without pyahocorasick.
+    
+    Each keyword maps to the buckets it belongs to, so one pass over a text
+    finds the buckets of all its keyword substrings.
+    """
+    if ahocorasick is None:
+        return None
+    
+    keyword_buckets: Dict[str, List[int]] = {}
+    for bucket, keywords in enumerate(_BUCKET_KEYWORDS):
+        for keyword in keywords:
+            keyword_buckets.setdefault(keyword, []).append(bucket)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, buckets in keyword_buckets.items():
+        automaton.add_word(keyword, tuple(buckets))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _keyword_automaton()
+
+
 def extract_topics(texts: List[str], num_topics: int = 5, num_words: int = 10) -> List[Dict[str, Any]]:
     """
     Extract topics from a list of texts using Latent Dirichlet Allocation.
@@ -68,16 +250,24 @@ def extract_topics(texts: List[str], num_topics: int = 5, num_words: int = 10) -
         # Get feature names
         feature_names = vectorizer.get_feature_names_out()
         
+        # Weight of every topic, from a single pass over the components
+        weights = lda.components_.sum(axis=1) / lda.components_.sum()
+        
         # Extract topics
         topics = []
+        top_count = min(num_words, lda.components_.shape[1])
         for topic_idx, topic in enumerate(lda.components_):
-            top_word_indices = topic.argsort()[:-num_words-1:-1]
+            # Partition out the top words, then sort only those
+            top_word_indices = []
+            if top_count > 0:
+                top_word_indices = np.argpartition(topic, -top_count)[-top_count:]
+                top_word_indices = top_word_indices[np.argsort(topic[top_word_indices])[::-1]]
             top_words = [feature_names[i] for i in top_word_indices]
             
             topics.append({
                 "id": topic_idx,
                 "words": top_words,
-                "weight": float(topic.sum() / lda.components_.sum())
+                "weight": float(weights[topic_idx])
             })
         
         return topics
@@ -86,6 +276,146 @@ def extract_topics(texts: List[str], num_topics: int = 5, num_words: int = 10) -
         return [{"id": i, "words": [], "weight": 0.0} for i in range(num_topics)]
 
 
+def _count_matches(text_lower: str, patterns: Dict[str, "re.Pattern[str]"], counts: Dict[str, int]) -> None:
+    """Count a lowercased text once for every bucket whose pattern it matches."""
+    for name, pattern in patterns.items():
+        if pattern.search(text_lower):
+            counts[name] += 1
+
+
+def _to_percentages(counts: Dict[str, int]) -> Dict[str, float]:
+    """Convert counts to percentages of their total, or zeros if there are none."""
+    total = sum(counts.values())
+    if total > 0:
+        return {key: round((count / total) * 100, 1) for key, count in counts.items()}
+    return {key: 0.0 for key in counts}
+
+
+def _sentiment_distribution(compounds: np.ndarray) -> Dict[str, float]:
+    """Convert VADER compound scores to a sentiment distribution."""
+    sentiments = {label: 0.0 for label in reversed(_SENTIMENT_LABELS)}
+    
+    # Bucket all compound scores at once
+    counts = np.bincount(np.searchsorted(_SENTIMENT_BOUNDS, compounds), minlength=len(_SENTIMENT_LABELS))
+    
+    # Convert to percentages
+    total = len(compounds)
+    if total > 0:
+        percentages = counts / total * 100
+        for index, label in enumerate(_SENTIMENT_LABELS):
+            sentiments[label] = round(float(percentages[index]), 1)
+    
+    return sentiments
+
+
+def _key_advocacy_phrases(advocacy_texts: List[str], limit: int = 10) -> List[str]:
+    """
+    Extract up to limit distinct advocacy noun phrases, in order of appearance.
+    
+    Args:
+        advocacy_texts: Texts containing advocacy signals
+        limit: Maximum number of phrases
+        
+    Returns:
+        List of distinct noun phrases containing an advocacy keyword
+    """
+    seen = set()
+    key_phrases = []
+    # Limit to 5 texts for efficiency. Noun chunks need the tagger,
+    # attribute ruler (for POS) and parser, plus the tok2vec they listen
+    # to, so only NER and the lemmatizer can be skipped.
+    for doc in nlp.pipe(advocacy_texts[:5], batch_size=5, disable=["ner", "lemmatizer"]):
+        # Lowercase each text once and slice chunks out of it by offset,
+        # unless lowercasing changes its length (e.g. "İ")
+        doc_lower = doc.text.lower()
+        same_offsets = len(doc_lower) == len(doc.text)
+        for chunk in doc.noun_chunks:
+            phrase = chunk.text
+            if phrase in seen:
+                continue
+            phrase_lower = doc_lower[chunk.start_char:chunk.end_char] if same_offsets else phrase.lower()
+            if _ADVOCACY_PATTERN.search(phrase_lower):
+                seen.add(phrase)
+                key_phrases.append(phrase)
+                # Stop parsing once enough phrases are found
+                if len(key_phrases) == limit:
+                    return key_phrases
+    return key_phrases
+
+
+def _advocacy_summary(total_texts: int, advocacy_texts: List[str], advocacy_compounds: np.ndarray) -> Dict[str, Any]:
+    """
+    Summarize the advocacy texts found among the non-empty texts of a corpus.
+    
+    Args:
+        total_texts: Number of non-empty texts
+        advocacy_texts: Texts containing advocacy signals
+        advocacy_compounds: VADER compound score of each advocacy text
+        
+    Returns:
+        Dictionary with advocacy analysis results
+    """
+    # Calculate advocacy strength and percentage
+    advocates_percentage = (len(advocacy_texts) / total_texts) * 100 if total_texts > 0 else 0.0
+    
+    # Calculate advocacy strength (0-100)
+    # This is a combination of the percentage of advocates and the sentiment of advocacy texts
+    sentiment_score = 0.0
+    if advocacy_texts:
+        sentiment_score = float((advocacy_compounds.mean() + 1.0) * 50.0)  # Convert to 0-100 scale
+    
+    advocacy_strength = (advocates_percentage + sentiment_score) / 2 if advocacy_texts else 0.0
+    
+    # Extract distinct key advocacy phrases
+    key_phrases = _key_advocacy_phrases(advocacy_texts) if advocacy_texts else []
+    
+    return {
+        "strength": round(advocacy_strength, 1),
+        "advocates_percentage": round(advocates_percentage, 1),
+        "key_advocacy_phrases": key_phrases
+    }
+
+
+def _region_distribution(region_counts: Dict[str, int]) -> Dict[str, float]:
+    """Convert region counts to a geographic distribution."""
+    if sum(region_counts.values()) > 0:
+        return _to_percentages(region_counts)
+    
+    # Default distribution if no regions detected
+    return dict(_REGION_DEFAULTS)
+
+
+def _count_demographics(text_lower: str, counts: List[int]) -> None:
+    """Count a lowercased text once for every demographic subcategory it mentions."""
+    for index, (_, _, pattern) in enumerate(_DEMOGRAPHIC_TABLE):
+        if pattern.search(text_lower):
+            counts[index] += 1
+
+
+def _demographic_distribution(counts: List[int]) -> Dict[str, Dict[str, float]]:
+    """Convert flat demographic counts to a distribution per demographic category."""
+    demo_counts = _empty_demographic_counts()
+    for (category, subcategory, _), count in zip(_DEMOGRAPHIC_TABLE, counts):
+        demo_counts[category][subcategory] = count
+    
+    distributions = {}
+    for category, subcategories in demo_counts.items():
+        if sum(subcategories.values()) > 0:
+            distributions[category] = _to_percentages(subcategories)
+        # Default distributions if no demographics detected
+        elif category in _DEMOGRAPHIC_DEFAULTS:
+            distributions[category] = dict(_DEMOGRAPHIC_DEFAULTS[category])
+    return distributions
+
+
+def _empty_demographic_counts() -> Dict[str, Dict[str, int]]:
+    """Create zeroed demographic counts for every category and subcategory."""
+    return {
+        category: {subcategory: 0 for subcategory in subcategories}
+        for category, subcategories in DEMOGRAPHIC_KEYWORDS.items()
+    }
+
+
 def analyze_sentiment(texts: List[str]) -> Dict[str, float]:
     """
     Analyze sentiment distribution in a list of texts.
@@ -96,51 +426,16 @@ def analyze_sentiment(texts: List[str]) -> Dict[str, float]:
     Returns:
         Dictionary with sentiment distribution
     """
-    # Initialize sentiment analyzer
-    sia = SentimentIntensityAnalyzer()
-    
-    # Initialize sentiment counts
-    sentiments = {
-        "Very Positive": 0,
-        "Positive": 0,
-        "Neutral": 0,
-        "Negative": 0,
-        "Very Negative": 0
-    }
-    
     # Handle empty input
     if not texts:
-        return {k: 0.0 for k in sentiments.keys()}
-    
-    # Analyze each text
-    for text in texts:
-        if not text.strip():
-            continue
-            
-        score = sia.polarity_scores(text)
-        compound = score["compound"]
-        
-        if compound >= 0.5:
-            sentiments["Very Positive"] += 1
-        elif compound >= 0.1:
-            sentiments["Positive"] += 1
-        elif compound > -0.1:
-            sentiments["Neutral"] += 1
-        elif compound > -0.5:
-            sentiments["Negative"] += 1
-        else:
-            sentiments["Very Negative"] += 1
+        return {label: 0.0 for label in reversed(_SENTIMENT_LABELS)}
     
-    # Convert to percentages
-    total = sum(sentiments.values())
-    if total > 0:
-        for key in sentiments:
-            sentiments[key] = round((sentiments[key] / total) * 100, 1)
-    else:
-        for key in sentiments:
-            sentiments[key] = 0.0
-    
-    return sentiments
+    # Score each non-empty text
+    compounds = np.fromiter(
+        (_SIA.polarity_scores(text)["compound"] for text in texts if text.strip()),
+        dtype=np.float64
+    )
+    return _sentiment_distribution(compounds)
 
 
 def detect_intent_signals(texts: List[str]) -> Dict[str, float]:
@@ -153,59 +448,19 @@ def detect_intent_signals(texts: List[str]) -> Dict[str, float]:
     Returns:
         Dictionary with intent signal distribution
     """
-    # Define intent signal keywords
-    intent_keywords = {
-        "awareness": [
-            "heard about", "what is", "who is", "learn more", "tell me about",
-            "new", "discover", "found out", "just saw", "introduction"
-        ],
-        "consideration": [
-            "compare", "versus", "vs", "better than", "alternative", "review",
-            "rating", "price", "cost", "worth it", "features", "thinking about",
-            "considering", "should I", "pros and cons"
-        ],
-        "conversion": [
-            "bought", "purchased", "ordered", "buy", "get", "where to buy",
-            "discount", "coupon", "deal", "sale", "in stock", "shipping",
-            "delivery", "add to cart", "checkout"
-        ]
-    }
-    
     # Initialize intent counts
-    intents = {
-        "awareness": 0,
-        "consideration": 0,
-        "conversion": 0
-    }
+    intents = {intent: 0 for intent in INTENT_KEYWORDS}
     
     # Handle empty input
     if not texts:
         return {k: 0.0 for k in intents.keys()}
     
-    # Analyze each text
+    # Check each text for intent signals
     for text in texts:
-        if not text.strip():
-            continue
-            
-        text_lower = text.lower()
-        
-        # Check for intent signals
-        for intent, keywords in intent_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    intents[intent] += 1
-                    break
-    
-    # Convert to percentages
-    total = sum(intents.values())
-    if total > 0:
-        for key in intents:
-            intents[key] = round((intents[key] / total) * 100, 1)
-    else:
-        for key in intents:
-            intents[key] = 0.0
+        if text.strip():
+            _count_matches(text.lower(), _INTENT_PATTERNS, intents)
     
-    return intents
+    return _to_percentages(intents)
 
 
 def detect_advocacy(texts: List[str]) -> Dict[str, Any]:
@@ -218,18 +473,6 @@ def detect_advocacy(texts: List[str]) -> Dict[str, Any]:
     Returns:
         Dictionary with advocacy analysis results
     """
-    # Define advocacy keywords
-    advocacy_keywords = [
-        "recommend", "love", "best", "amazing", "excellent", "awesome",
-        "great", "fantastic", "outstanding", "superb", "favorite", "perfect",
-        "must-have", "must try", "life-changing", "game-changer", "changed my life",
-        "never going back", "loyal", "fan", "advocate", "evangelist", "ambassador"
-    ]
-    
-    # Initialize advocacy data
-    advocacy_count = 0
-    advocacy_texts = []
-    
     # Handle empty input
     if not texts:
         return {
@@ -238,54 +481,16 @@ def detect_advocacy(texts: List[str]) -> Dict[str, Any]:
             "key_advocacy_phrases": []
         }
     
-    # Analyze each text
-    for text in texts:
-        if not text.strip():
-            continue
-            
-        text_lower = text.lower()
-        is_advocacy = False
-        
-        # Check for advocacy signals
-        for keyword in advocacy_keywords:
-            if keyword in text_lower:
-                advocacy_count += 1
-                advocacy_texts.append(text)
-                is_advocacy = True
-                break
-    
-    # Calculate advocacy strength and percentage
-    total_texts = len([t for t in texts if t.strip()])
-    advocates_percentage = (advocacy_count / total_texts) * 100 if total_texts > 0 else 0.0
-    
-    # Calculate advocacy strength (0-100)
-    # This is a combination of the percentage of advocates and the sentiment of advocacy texts
-    sentiment_score = 0.0
-    if advocacy_texts:
-        sia = SentimentIntensityAnalyzer()
-        sentiment_scores = [sia.polarity_scores(text)["compound"] for text in advocacy_texts]
-        sentiment_score = (sum(sentiment_scores) / len(sentiment_scores) + 1) / 2 * 100  # Convert to 0-100 scale
-    
-    advocacy_strength = (advocates_percentage + sentiment_score) / 2 if advocacy_texts else 0.0
-    
-    # Extract key advocacy phrases
-    key_phrases = []
-    if advocacy_texts:
-        for text in advocacy_texts[:5]:  # Limit to 5 texts for efficiency
-            doc = nlp(text)
-            for sent in doc.sents:
-                for chunk in sent.noun_chunks:
-                    if any(keyword in chunk.text.lower() for keyword in advocacy_keywords):
-                        key_phrases.append(chunk.text)
-    
-    # Limit and deduplicate key phrases
-    key_phrases = list(set(key_phrases))[:10]
+    # Check each text for advocacy signals
+    texts = [text for text in texts if text.strip()]
+    advocacy_texts = [text for text in texts if _ADVOCACY_PATTERN.search(text.lower())]
+    advocacy_compounds = np.fromiter(
+        (_SIA.polarity_scores(text)["compound"] for text in advocacy_texts),
+        dtype=np.float64,
+        count=len(advocacy_texts)
+    )
     
-    return {
-        "strength": round(advocacy_strength, 1),
-        "advocates_percentage": round(advocates_percentage, 1),
-        "key_advocacy_phrases": key_phrases
-    }
+    return _advocacy_summary(len(texts), advocacy_texts, advocacy_compounds)
 
 
 def extract_geographic_mentions(texts: List[str]) -> Dict[str, float]:
@@ -298,56 +503,17 @@ def extract_geographic_mentions(texts: List[str]) -> Dict[str, float]:
     Returns:
         Dictionary with geographic distribution
     """
-    # Define major regions and countries
-    regions = {
-        "North America": ["usa", "united states", "america", "canada", "mexico"],
-        "Europe": ["europe", "uk", "united kingdom", "germany", "france", "italy", "spain"],
-        "Asia": ["asia", "china", "japan", "india", "korea", "singapore"],
-        "Australia/Oceania": ["australia", "new zealand", "oceania"],
-        "South America": ["brazil", "argentina", "colombia", "chile", "peru"],
-        "Africa": ["africa", "south africa", "nigeria", "kenya", "egypt"],
-        "Middle East": ["middle east", "uae", "dubai", "saudi arabia", "israel"]
-    }
-    
-    # Initialize region counts
-    region_counts = {region: 0 for region in regions}
-    
     # Handle empty input
     if not texts:
-        return {k: 0.0 for k in region_counts.keys()}
+        return dict(_ZERO_REGIONS)
     
-    # Analyze each text
+    # Check each text for region mentions
+    region_counts = {region: 0 for region in REGION_KEYWORDS}
     for text in texts:
-        if not text.strip():
-            continue
-            
-        text_lower = text.lower()
-        
-        # Check for region mentions
-        for region, keywords in regions.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    region_counts[region] += 1
-                    break
+        if text.strip():
+            _count_matches(text.lower(), _REGION_PATTERNS, region_counts)
     
-    # Convert to percentages
-    total = sum(region_counts.values())
-    if total > 0:
-        for key in region_counts:
-            region_counts[key] = round((region_counts[key] / total) * 100, 1)
-    else:
-        # Default distribution if no regions detected
-        region_counts = {
-            "North America": 40.0,
-            "Europe": 25.0,
-            "Asia": 20.0,
-            "Australia/Oceania": 5.0,
-            "South America": 5.0,
-            "Africa": 3.0,
-            "Middle East": 2.0
-        }
-    
-    return region_counts
+    return _region_distribution(region_counts)
 
 
 def extract_demographic_mentions(texts: List[str]) -> Dict[str, Dict[str, float]]:
@@ -360,87 +526,139 @@ def extract_demographic_mentions(texts: List[str]) -> Dict[str, Dict[str, float]
     Returns:
         Dictionary with demographic distributions
     """
-    # Define demographic keywords
-    demographics = {
-        "age_groups": {
-            "Under 18": ["teen", "teenager", "high school", "young", "kid", "child"],
-            "18-24": ["college", "university", "student", "young adult", "early 20s"],
-            "25-34": ["young professional", "millennial", "30s", "thirties", "late 20s"],
-            "35-44": ["parent", "family", "40s", "forties", "mid-career"],
-            "45-54": ["middle-aged", "experienced", "50s", "fifties"],
-            "55+": ["senior", "retired", "elder", "boomer", "older"]
-        },
-        "gender": {
-            "Male": ["man", "men", "male", "guy", "boy", "father", "dad", "husband", "boyfriend"],
-            "Female": ["woman", "women", "female", "girl", "mother", "mom", "wife", "girlfriend"],
-            "Other/Unspecified": ["non-binary", "they", "them", "person", "people"]
-        },
-        "income_levels": {
-            "Low": ["budget", "affordable", "cheap", "low income", "struggling", "poor"],
-            "Middle": ["middle class", "average", "moderate", "standard"],
-            "High": ["luxury", "premium", "high-end", "wealthy", "rich", "affluent"]
-        }
-    }
-    
-    # Initialize demographic counts
-    demo_counts = {
-        category: {subcategory: 0 for subcategory in subcategories}
-        for category, subcategories in demographics.items()
-    }
-    
     # Handle empty input
     if not texts:
-        return {
-            category: {subcategory: 0.0 for subcategory in subcategories}
-            for category, subcategories in demographics.items()
-        }
+        return {category: dict(zeros) for category, zeros in _ZERO_DEMOGRAPHICS.items()}
+    
+    # Check each text for demographic mentions
+    demo_counts = [0] * len(_DEMOGRAPHIC_TABLE)
+    for text in texts:
+        if text.strip():
+            _count_demographics(text.lower(), demo_counts)
+    
+    return _demographic_distribution(demo_counts)
+
+
+class _CorpusCounts(NamedTuple):
+    """Raw per-text results of analyze_corpus over a sequence of texts, before any distribution is computed."""
+    compounds: List[float]
+    advocacy_texts: List[str]
+    advocacy_compounds: List[float]
+    # Number of texts mentioning each keyword bucket, in _BUCKET_KEYWORDS order
+    bucket_counts: List[int]
+
+
+def _keyword_buckets(text_lower: str) -> set:
+    """Find the keyword buckets with at least one keyword in a lowercased text."""
+    if _KEYWORD_AUTOMATON is None:
+        return {bucket for bucket, pattern in enumerate(_BUCKET_PATTERNS) if pattern.search(text_lower)}
+    
+    found = set()
+    for _, buckets in _KEYWORD_AUTOMATON.iter(text_lower):
+        found.update(buckets)
+    return found
+
+
+def _scan_corpus(texts: List[str]) -> _CorpusCounts:
+    """Score and count every non-blank text in a single pass."""
+    counts = _CorpusCounts(
+        compounds=[],
+        advocacy_texts=[],
+        advocacy_compounds=[],
+        bucket_counts=[0] * len(_BUCKET_KEYWORDS)
+    )
     
-    # Analyze each text
     for text in texts:
         if not text.strip():
             continue
-            
-        text_lower = text.lower()
         
-        # Check for demographic mentions
-        for category, subcategories in demographics.items():
-            for subcategory, keywords in subcategories.items():
-                for keyword in keywords:
-                    if keyword in text_lower:
-                        demo_counts[category][subcategory] += 1
-                        break
+        compound = _SIA.polarity_scores(text)["compound"]
+        counts.compounds.append(compound)
+        
+        buckets = _keyword_buckets(text.lower())
+        for bucket in buckets:
+            counts.bucket_counts[bucket] += 1
+        if _ADVOCACY_BUCKET in buckets:
+            counts.advocacy_texts.append(text)
+            counts.advocacy_compounds.append(compound)
+    
+    return counts
+
+
+def _merge_corpus_counts(parts: List[_CorpusCounts]) -> _CorpusCounts:
+    """Combine the counts of consecutive chunks of a corpus, keeping text order."""
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.compounds.extend(part.compounds)
+        merged.advocacy_texts.extend(part.advocacy_texts)
+        merged.advocacy_compounds.extend(part.advocacy_compounds)
+        for bucket, count in enumerate(part.bucket_counts):
+            merged.bucket_counts[bucket] += count
+    return merged
+
+
+def analyze_corpus(texts: List[str], workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run every per-text analysis over a list of texts in a single pass.
     
-    # Convert to percentages
-    for category, subcategories in demo_counts.items():
-        total = sum(subcategories.values())
-        if total > 0:
-            for subcategory in subcategories:
-                demo_counts[category][subcategory] = round((demo_counts[category][subcategory] / total) * 100, 1)
-        else:
-            # Default distributions if no demographics detected
-            if category == "age_groups":
-                demo_counts[category] = {
-                    "Under 18": 5.0,
-                    "18-24": 15.0,
-                    "25-34": 30.0,
-                    "35-44": 25.0,
-                    "45-54": 15.0,
-                    "55+": 10.0
-                }
-            elif category == "gender":
-                demo_counts[category] = {
-                    "Male": 48.0,
-                    "Female": 48.0,
-                    "Other/Unspecified": 4.0
-                }
-            elif category == "income_levels":
-                demo_counts[category] = {
-                    "Low": 30.0,
-                    "Middle": 50.0,
-                    "High": 20.0
-                }
-    
-    return demo_counts
+    Each text is stripped, lowercased and scored by VADER once, and all
+    keywords are matched on that one lowercased copy, in a single
+    Aho-Corasick pass when pyahocorasick is installed. Advocacy strength
+    reuses the sentiment scores instead of scoring advocacy texts again.
+    Prefer this over calling the individual functions when more than one
+    result is needed.
+    
+    VADER scoring and regex matching hold the GIL, so large corpora are
+    parallelized across processes rather than threads: with workers set,
+    the texts are split into one chunk per worker and the raw counts of
+    the chunks are merged. This only pays off for corpora of many
+    thousands of texts, given the cost of starting the pool.
+    
+    Args:
+        texts: List of text documents
+        workers: Number of worker processes, or None to analyze in this
+            process; 0 means os.cpu_count()
+        
+    Returns:
+        Dictionary with the results of analyze_sentiment ("sentiment"),
+        detect_intent_signals ("intent_signals"), detect_advocacy ("advocacy"),
+        extract_geographic_mentions ("geographic") and
+        extract_demographic_mentions ("demographics")
+    """
+    # Handle empty input, whose results differ from those of blank texts
+    if not texts:
+        return {
+            "sentiment": analyze_sentiment(texts),
+            "intent_signals": detect_intent_signals(texts),
+            "advocacy": detect_advocacy(texts),
+            "geographic": extract_geographic_mentions(texts),
+            "demographics": extract_demographic_mentions(texts)
+        }
+    
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    
+    if workers is None or workers <= 1 or len(texts) < workers:
+        counts = _scan_corpus(texts)
+    else:
+        # Consecutive chunks, so merging keeps the texts in their original order
+        chunk_size = -(-len(texts) // workers)
+        chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            counts = _merge_corpus_counts(list(executor.map(_scan_corpus, chunks)))
+    
+    bucket_counts = counts.bucket_counts
+    return {
+        "sentiment": _sentiment_distribution(np.asarray(counts.compounds, dtype=np.float64)),
+        "intent_signals": _to_percentages(dict(zip(INTENT_KEYWORDS, bucket_counts[_INTENT_BUCKETS]))),
+        "advocacy": _advocacy_summary(
+            len(counts.compounds),
+            counts.advocacy_texts,
+            np.asarray(counts.advocacy_compounds, dtype=np.float64)
+        ),
+        "geographic": _region_distribution(dict(zip(REGION_KEYWORDS, bucket_counts[_REGION_BUCKETS]))),
+        "demographics": _demographic_distribution(bucket_counts[_DEMOGRAPHIC_BUCKETS])
+    }
 
 
 def generate_sample_conversations(brand_name: str, industry: str, count: int = 100) -> List[str]: